@@ -9,15 +9,24 @@ Simplified implementation using DSPy structured output.
 from .dspy_core import DSPyQuizChallenge as LLMQuizChallenge
 from .dspy_core import QuizQuestion, QuizResult, QuizResults
 
-# DSPy signatures for advanced usage
-from .dspy_signatures import (
-    AnswerQuizQuestion,
-    EvaluateAnswer,
-    GenerateFeedback,
-    ParseQuestionAndAnswer,
-    ValidateQuestion,
-    ValidationIssue,
-)
+# DSPy signatures for advanced usage, imported on first access since they pull in dspy
+_SIGNATURE_EXPORTS = {
+    "AnswerQuizQuestion",
+    "EvaluateAnswer",
+    "GenerateFeedback",
+    "ParseQuestionAndAnswer",
+    "ValidateQuestion",
+    "ValidationIssue",
+}
+
+
+def __getattr__(name):
+    if name in _SIGNATURE_EXPORTS:
+        from . import dspy_signatures
+
+        return getattr(dspy_signatures, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = "3.0.0"
 __all__ = [
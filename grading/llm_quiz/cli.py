@@ -19,7 +19,7 @@ except ImportError:
 import colorama
 from colorama import Back, Fore, Style
 
-from .dspy_core import DSPyQuizChallenge, QuizResult, QuizResults
+from .dspy_core import SKIPPED_FAST_FAIL, DSPyQuizChallenge, QuizResult, QuizResults
 
 # Initialize colorama for cross-platform color support
 colorama.init()
@@ -47,6 +47,7 @@ class Colors:
     WIN = Fore.GREEN + Style.BRIGHT
     LOSE = Fore.RED + Style.BRIGHT
     INVALID = Fore.YELLOW + Style.BRIGHT
+    SKIPPED = Fore.WHITE + Style.DIM
 
     # Reset
     RESET = Style.RESET_ALL
@@ -139,9 +140,12 @@ def format_revision_guidance(results: QuizResults) -> str:
     if not results.question_results:
         return ""
 
-    # Only show guidance for questions that need improvement (lost to AI or invalid)
+    # Only show guidance for questions that need improvement (lost to AI or invalid);
+    # questions skipped by fast-fail were never graded, so there is nothing to revise yet
     needs_improvement = []
     for result in results.question_results:
+        if result.error == SKIPPED_FAST_FAIL:
+            continue
         if not result.is_valid or not result.student_wins:
             needs_improvement.append(result)
 
@@ -283,6 +287,13 @@ GitHub Classroom Integration:
     # Output configuration
     parser.add_argument("--output", type=Path, help="Output JSON file for detailed results")
 
+    parser.add_argument(
+        "--partial-output",
+        type=Path,
+        help="JSON-lines file that receives each question result as it completes; "
+        "re-running with the same file resumes an interrupted run",
+    )
+
     # Behavior options
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging output")
 
@@ -314,6 +325,48 @@ GitHub Classroom Integration:
         help="Disable fact-checking of student answers (trust student answers as ground truth)",
     )
 
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of questions processed in parallel (default: 8)",
+    )
+
+    parser.add_argument(
+        "--max-llm-requests",
+        type=int,
+        default=None,
+        help="Maximum number of LLM requests in flight at once; size it to the provider's "
+        "rate limit (default: $LLM_MAX_CONCURRENCY, else --max-concurrency)",
+    )
+
+    parser.add_argument(
+        "--batch-prompting",
+        action="store_true",
+        help="Validate, answer, and evaluate all questions with one LLM call per stage",
+    )
+
+    parser.add_argument(
+        "--no-fast-fail",
+        dest="fast_fail",
+        action="store_false",
+        help="Grade every question even after one question already rules out passing",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        default=".dspy_cache",
+        help="Directory for the on-disk LLM response cache (default: .dspy_cache)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        dest="cache_dir",
+        action="store_const",
+        const=None,
+        help="Disable the on-disk LLM response cache",
+    )
+
     return parser
 
 
@@ -335,6 +388,15 @@ def main():
         sys.exit(1)
 
     try:
+        if args.cache_dir:
+            import dspy
+
+            # Persist LLM responses on disk so re-runs during grading iteration replay
+            # instantly. Entries are keyed on the full request (model, messages including the
+            # course context, and parameters), so editing the quiz or course materials
+            # naturally misses the cache.
+            dspy.configure_cache(enable_disk_cache=True, disk_cache_dir=args.cache_dir)
+
         # Initialize DSPy LLM Quiz Challenge with progress indicators
         print(f"{Colors.INFO}🔧 Initializing quiz system...{Colors.RESET}")
         logger.info("Initializing DSPy LLM Quiz Challenge...")
@@ -353,6 +415,10 @@ def main():
             context_urls_file=args.context_urls,
             context_strictness=args.context_strictness,
             verify_student_answers=args.verify_answers,
+            max_concurrency=args.max_concurrency,
+            max_llm_requests=args.max_llm_requests,
+            batch_prompting=args.batch_prompting,
+            cache_dir=args.cache_dir,
         )
 
         # Load and run quiz
@@ -361,7 +427,9 @@ def main():
         print(
             f"{Colors.INFO}🚀 Starting quiz challenge with {len(questions)} questions...{Colors.RESET}"
         )
-        results = challenge.run_quiz_challenge(questions)
+        results = challenge.run_quiz_challenge(
+            questions, partial_output=args.partial_output, fast_fail=args.fast_fail
+        )
 
         # Display clear pass/fail result first
         print("=" * 80)
@@ -380,6 +448,10 @@ def main():
             f"{Colors.INFO}📊 Summary:{Colors.RESET} {results.student_wins}/{results.valid_questions} questions stumped the AI"
         )
         print(f"{Colors.INFO}Success Rate:{Colors.RESET} {results.success_rate:.1%}")
+        if results.skipped_questions:
+            print(
+                f"{Colors.INFO}Not graded:{Colors.RESET} {results.skipped_questions} question(s) skipped after an earlier question ruled out a pass"
+            )
         print()
 
         # Display detailed results for each question
@@ -419,6 +491,13 @@ def main():
                 print(
                     f"  {Colors.HEADER}Evaluation:{Colors.RESET} {Colors.EVALUATION}{result.evaluation_explanation}{Colors.RESET}"
                 )
+            elif result.error == SKIPPED_FAST_FAIL:
+                print(
+                    f"{Colors.HEADER}Question {result.question.number}:{Colors.RESET} {Colors.SKIPPED}⏭️ Not graded{Colors.RESET}"
+                )
+                print(
+                    f"  {Colors.HEADER}Your question:{Colors.RESET} {Colors.QUESTION}{result.question.question}{Colors.RESET}"
+                )
             else:
                 print(
                     f"{Colors.HEADER}Question {result.question.number}:{Colors.RESET} {Colors.INVALID}⚠️ Invalid{Colors.RESET}"
@@ -5,52 +5,125 @@ This module replaces the complex manual prompt engineering and JSON parsing
 with clean DSPy signatures and modules.
 """
 
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.util
 import json
 import logging
-import urllib.error
-import urllib.request
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, Iterable, List, Optional, Tuple, Type
 
-import dspy
 from tqdm import tqdm
 
 try:
-    import tomllib  # Python 3.11+
+    import orjson  # Fast JSON encoder, normally installed alongside LiteLLM
 except ImportError:
-    import tomli as tomllib  # Fallback for Python < 3.11
+    orjson = None
 
-try:
-    from .dspy_signatures import (
-        AnswerQuizQuestion,
-        CheckContextAlignment,
-        EvaluateAnswer,
-        GenerateFeedback,
-        GenerateRevisionGuidance,
-        ParseQuestionAndAnswer,
-        ValidateQuestion,
-        ValidateQuestionSimilarity,
-        ValidationIssue,
-    )
-except ImportError:
-    # Handle relative import for standalone execution
-    from dspy_signatures import (
-        AnswerQuizQuestion,
-        CheckContextAlignment,
-        EvaluateAnswer,
-        GenerateFeedback,
-        GenerateRevisionGuidance,
-        ParseQuestionAndAnswer,
-        ValidateQuestion,
-        ValidateQuestionSimilarity,
-        ValidationIssue,
-    )
+if TYPE_CHECKING:
+    import dspy
+
+# dspy (with LiteLLM and pydantic), httpx, and tomllib are imported where they are used, so
+# the result dataclasses below import without them
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None  # Enables HTTP/2 in httpx
+
+
+@lru_cache(maxsize=None)
+def _signatures():
+    """Import the DSPy signatures module, which pulls in dspy, on first use."""
+    try:
+        from . import dspy_signatures
+    except ImportError:
+        # Handle relative import for standalone execution
+        import dspy_signatures
+    return dspy_signatures
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class _ValidationCache:
+    """Content-addressed store of confident validator and evaluator verdicts.
+
+    Students often submit the same question with trivial differences in spacing, which the
+    LLM response cache keys apart. Entries here are keyed on the whitespace-normalized
+    inputs instead, held in a small in-process LRU in front of a diskcache store. Case is
+    kept, since it carries meaning in the course notation (k/K, n/N, G/g).
+    """
+
+    def __init__(self, directory: str, memory_size: int = 1024):
+        from diskcache import Cache
+
+        self._disk = Cache(directory)
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._memory_size = memory_size
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(*parts: Optional[str]) -> str:
+        """Hash the whitespace-normalized parts into a cache key."""
+        normalized = [" ".join((part or "").split()) for part in parts]
+        # JSON keeps part boundaries unambiguous, even for text containing separators
+        return hashlib.sha256(json.dumps(normalized).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        value = self._disk.get(key)
+        if value is not None:
+            self._remember(key, value)
+        return value
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        # Store enum members (e.g. ValidationIssue) by value so entries unpickle without
+        # the signatures module, whichever way it was imported
+        value = {
+            name: [getattr(item, 'value', item) for item in field]
+            if isinstance(field, list)
+            else getattr(field, 'value', field)
+            for name, field in value.items()
+        }
+        self._disk.set(key, value)
+        self._remember(key, value)
+
+    def _remember(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            if len(self._memory) > self._memory_size:
+                self._memory.popitem(last=False)
+
+
+@lru_cache(maxsize=None)
+def _signature_hash(signature: type) -> str:
+    """Hash a signature's instructions and fields, so editing either misses cached verdicts."""
+    fields = {
+        name: [repr(field.annotation), field.json_schema_extra]
+        for name, field in signature.fields.items()
+    }
+    return hashlib.sha256(
+        json.dumps([signature.instructions, fields], sort_keys=True, default=repr).encode("utf-8")
+    ).hexdigest()
+
+
+# Error marker for questions left ungraded once the student could no longer pass
+SKIPPED_FAST_FAIL = "skipped_fast_fail"
+
+# Slotted dataclasses skip the per-instance __dict__; slots= needs Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class QuizQuestion:
     """Represents a single quiz question created by the student."""
 
@@ -59,7 +132,7 @@ class QuizQuestion:
     number: int
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RevisionGuidance:
     """Detailed revision guidance for a question."""
 
@@ -72,7 +145,7 @@ class RevisionGuidance:
     clarity_improvements: List[str]
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class QuizResult:
     """Result for a single question created by the student."""
 
@@ -93,7 +166,7 @@ class QuizResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class QuizResults:
     """Complete quiz challenge results."""
 
@@ -109,6 +182,55 @@ class QuizResults:
     student_passes: bool
     github_classroom_result: str
     similarity_analysis: Optional[Dict[str, Any]] = None  # Added similarity analysis results
+    skipped_questions: int = 0  # Left ungraded by fast-fail; not counted as invalid
+
+
+
+def _run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion from synchronous code.
+
+    asyncio.run cannot nest inside a running event loop (e.g. Jupyter or marimo), so in
+    that case the coroutine runs on a fresh loop in a worker thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _quiz_result_from_dict(data: Dict[str, Any]) -> QuizResult:
+    """Rebuild a QuizResult from its asdict() form."""
+    data = dict(data)
+    data["question"] = QuizQuestion(**data["question"])
+    if data.get("revision_guidance") is not None:
+        data["revision_guidance"] = RevisionGuidance(**data["revision_guidance"])
+    return QuizResult(**data)
+
+
+def _make_result(
+    question: QuizQuestion,
+    *,
+    llm_answer: str = "",
+    is_valid: bool = False,
+    student_wins: bool = False,
+    explanation: str = "",
+    issues: Iterable[str] = (),
+    error: Optional[str] = None,
+    **details: Any,
+) -> QuizResult:
+    """Build a QuizResult; details fills the optional assessment fields."""
+    return QuizResult(
+        question=question,
+        llm_answer=llm_answer,
+        is_valid=is_valid,
+        student_wins=student_wins,
+        evaluation_explanation=explanation,
+        validation_issues=list(issues),
+        error=error,
+        **details,
+    )
 
 
 class DSPyQuizChallenge:
@@ -126,8 +248,14 @@ class DSPyQuizChallenge:
         dspy_lm: Optional[dspy.LM] = None,
         context_strictness: str = "normal",
         verify_student_answers: bool = True,
+        max_concurrency: int = 8,
+        batch_prompting: bool = False,
+        max_llm_requests: Optional[int] = None,
+        cache_dir: Optional[str] = ".dspy_cache",
     ):
         """Initialize the DSPy-based quiz challenge system."""
+        import dspy
+        signatures = _signatures()
 
         # Configure DSPy with the provided LLM
         self.base_url = base_url.rstrip("/")
@@ -135,9 +263,24 @@ class DSPyQuizChallenge:
         self.quiz_model = quiz_model
         self.evaluator_model = evaluator_model
 
+        # LLM responses go through DSPy's response cache, whose location is process-wide
+        # and configured by the caller (the CLI points it at --cache-dir). Without a
+        # cache_dir this challenge's own LMs bypass it entirely.
+        self.cache_lm_responses = bool(cache_dir)
+
         # Set up DSPy LM - use provided instance or create one
         self.lm = dspy_lm if dspy_lm is not None else self._create_dspy_lm()
 
+        # Quiz model LM is built once and shared by every question (and worker thread)
+        # so its client and connection pool are reused rather than rebuilt per call
+        self.quiz_lm = dspy.LM(
+            model=self.quiz_model,
+            api_base=self.base_url,
+            api_key=self.api_key,
+            temperature=0,  # Deterministic requests keep cache keys stable
+            cache=self.cache_lm_responses,
+        )
+
         # Load context content from URLs file or use provided content directly
         if context_content:
             # Use provided content directly
@@ -152,23 +295,65 @@ class DSPyQuizChallenge:
         self.enable_detailed_feedback = enable_detailed_feedback
         self.context_strictness = context_strictness  # "strict", "normal", or "lenient"
         self.verify_student_answers = verify_student_answers  # Enable fact-checking of student answers
-
-        # Initialize DSPy predictors - they will use the context when called
-        self.question_parser = dspy.Predict(ParseQuestionAndAnswer)
-        self.context_alignment_checker = dspy.ChainOfThought(CheckContextAlignment)
-        self.question_validator = dspy.ChainOfThought(ValidateQuestion)
-        self.similarity_validator = dspy.ChainOfThought(ValidateQuestionSimilarity)
-        self.question_answerer = dspy.Predict(AnswerQuizQuestion)
-        self.answer_evaluator = dspy.ChainOfThought(EvaluateAnswer)
-        self.feedback_generator = dspy.Predict(GenerateFeedback)
-        self.revision_guide_generator = dspy.Predict(GenerateRevisionGuidance)
+        self.max_concurrency = max_concurrency  # Upper bound on questions processed in parallel
+        self.batch_prompting = batch_prompting  # Validate, answer, and evaluate all questions in one call each
+        # Upper bound on LLM requests in flight at once, sized to the provider's rate limit.
+        # Each question awaits one request at a time, so it only binds below max_concurrency.
+        if max_llm_requests is None:
+            max_llm_requests = int(os.environ.get("LLM_MAX_CONCURRENCY", max_concurrency))
+        self.max_llm_requests = max_llm_requests
+        self._llm_semaphore: Optional[asyncio.Semaphore] = None  # Created per run, on its event loop
+        self._no_retry_lms: Dict[int, Tuple[Any, Any]] = {}  # LM id -> (LM, copy used by _acall)
+        self._rate_limited = 0  # Requests retried after a rate limit during the current run
+        self._partial_output_lock = threading.Lock()  # Serializes appends to the partial results file
+
+        # Confident verdicts are reused for repeated submissions of the same question. The
+        # context hash keeps verdicts from one set of course materials out of another.
+        self.validation_cache = (
+            _ValidationCache(os.path.join(cache_dir, "validation")) if cache_dir else None
+        )
+        self._context_hash = hashlib.sha256((self.context_content or "").encode("utf-8")).hexdigest()
+
+        # Initialize DSPy predictors - context-aware signatures carry the course context in
+        # their instructions, so it is not passed again on every call. Validation and
+        # evaluation use Predict: their reason/explanation fields already justify the verdict,
+        # so a separate chain-of-thought rationale would only add output tokens.
+        self.question_parser = dspy.Predict(signatures.ParseQuestionAndAnswer)
+        self.context_alignment_checker = dspy.ChainOfThought(self._with_context(signatures.CheckContextAlignment))
+        self.question_validator = dspy.Predict(self._with_context(signatures.ValidateQuestion))
+        self.similarity_validator = dspy.ChainOfThought(signatures.ValidateQuestionSimilarity)
+        self.question_answerer = dspy.Predict(self._with_context(signatures.AnswerQuizQuestion))
+        self.answer_evaluator = dspy.Predict(signatures.EvaluateAnswer)
+        self.feedback_generator = dspy.Predict(signatures.GenerateFeedback)
+        self.revision_guide_generator = dspy.Predict(signatures.GenerateRevisionGuidance)
+        self.batch_validator = dspy.Predict(self._with_context(signatures.BatchValidateQuestions))
+        self.batch_answerer = dspy.Predict(self._with_context(signatures.BatchAnswerQuestions))
+        self.batch_evaluator = dspy.Predict(signatures.BatchEvaluateAnswers)
 
         logger.info(
             f"DSPy Quiz Challenge initialized with models: quiz={quiz_model}, evaluator={evaluator_model}, context_strictness={context_strictness}"
         )
 
+    def _with_context(self, signature: Type[dspy.Signature]) -> Type[dspy.Signature]:
+        """Move the course context from a per-call input field into the signature instructions.
+
+        The adapter renders instructions into the system message, so the context becomes a
+        prefix that is identical for every question. It is built once here instead of being
+        re-serialized into each request, and providers that cache stable prompt prefixes can
+        reuse it across calls.
+        """
+        signature = signature.delete("context_content")
+        if not self.context_content:
+            return signature
+        return signature.with_instructions(
+            f"{signature.instructions}\n\n"
+            f"Course context materials:\n{self.context_content}"
+        )
+
     def _create_dspy_lm(self):
         """Create a DSPy LM wrapper for the existing API endpoint."""
+        import dspy
+
         logger.debug(
             f"Creating DSPy LM with base_url: {self.base_url}, evaluator_model: {self.evaluator_model}"
         )
@@ -177,21 +362,33 @@ class DSPyQuizChallenge:
             if "openrouter" in self.base_url.lower():
                 # OpenRouter
                 lm = dspy.LM(
-                    model=self.evaluator_model, api_base=self.base_url, api_key=self.api_key
+                    model=self.evaluator_model,
+                    api_base=self.base_url,
+                    api_key=self.api_key,
+                    temperature=0,
+                    cache=self.cache_lm_responses,
                 )
                 logger.debug("Created OpenRouter DSPy LM")
                 return lm
             elif "ollama" in self.base_url.lower() or ":11434" in self.base_url.lower():
                 # Ollama
                 lm = dspy.LM(
-                    model=self.evaluator_model, api_base=self.base_url, api_key=self.api_key
+                    model=self.evaluator_model,
+                    api_base=self.base_url,
+                    api_key=self.api_key,
+                    temperature=0,
+                    cache=self.cache_lm_responses,
                 )
                 logger.debug("Created Ollama DSPy LM")
                 return lm
             else:
                 # Default OpenAI-compatible
                 lm = dspy.LM(
-                    model=self.evaluator_model, api_base=self.base_url, api_key=self.api_key
+                    model=self.evaluator_model,
+                    api_base=self.base_url,
+                    api_key=self.api_key,
+                    temperature=0,
+                    cache=self.cache_lm_responses,
                 )
                 logger.debug("Created OpenAI-compatible DSPy LM")
                 return lm
@@ -214,19 +411,19 @@ class DSPyQuizChallenge:
             combined_content = []
             print(f"Loading {len(urls)} context URL(s)...")
 
-            for i, url in enumerate(urls, 1):
-                try:
-                    print(f"  Fetching {i}/{len(urls)}: {url}")
-                    req = urllib.request.Request(url, headers={"User-Agent": "llm-quiz-challenge"})
-                    with urllib.request.urlopen(req, timeout=30) as response:
-                        content = response.read().decode("utf-8")
-                        filename = url.split("/")[-1] if "/" in url else f"content_{i}"
-                        combined_content.append(f"# {filename} (from {url})\n\n{content}")
-                        logger.info(f"Loaded content from {url}")
-                        print(f"  ✓ Loaded {len(content)} characters")
-                except Exception as e:
-                    logger.error(f"Error loading {url}: {e}")
-                    print(f"  ✗ Failed to load: {e}")
+            # Fetch all URLs concurrently; wall time is bounded by the slowest URL
+            contents = _run_sync(self._fetch_urls(urls))
+
+            for i, (url, content) in enumerate(zip(urls, contents), 1):
+                print(f"  Fetched {i}/{len(urls)}: {url}")
+                if isinstance(content, Exception):
+                    logger.error(f"Error loading {url}: {content}")
+                    print(f"  ✗ Failed to load: {content}")
+                    continue
+                filename = url.split("/")[-1] if "/" in url else f"content_{i}"
+                combined_content.append(f"# {filename} (from {url})\n\n{content}")
+                logger.info(f"Loaded content from {url}")
+                print(f"  ✓ Loaded {len(content)} characters")
 
             if combined_content:
                 return "\n\n" + "=" * 80 + "\n\n".join(combined_content)
@@ -236,6 +433,31 @@ class DSPyQuizChallenge:
 
         return None
 
+    async def _fetch_urls(self, urls: List[str]) -> List[Any]:
+        """Download URLs concurrently, returning each body or the exception it raised."""
+        import httpx
+
+        # Cap concurrent sockets so long URL lists don't overwhelm the host
+        semaphore = asyncio.Semaphore(16)
+
+        # One pooled client for all URLs: requests to the same host reuse a kept-alive
+        # connection (and multiplex over HTTP/2 when available) instead of a new TLS handshake
+        async with httpx.AsyncClient(
+            timeout=30,
+            headers={"User-Agent": "llm-quiz-challenge"},
+            follow_redirects=True,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        ) as client:
+
+            async def fetch(url: str) -> str:
+                async with semaphore:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    return response.content.decode("utf-8")
+
+            return await asyncio.gather(*(fetch(url) for url in urls), return_exceptions=True)
+
     def _extract_context_topics(self) -> List[str]:
         """Extract main topics from context content for better revision guidance."""
         # Simplified - let the LLM figure out the topics from the context
@@ -247,6 +469,8 @@ class DSPyQuizChallenge:
         Returns:
             Dictionary with alignment details or None if no context available
         """
+        import dspy
+
         if not self.context_content:
             logger.debug("No context content available, skipping alignment check")
             return None
@@ -257,50 +481,74 @@ class DSPyQuizChallenge:
                 alignment_result = self.context_alignment_checker(
                     question=question.question,
                     answer=question.answer,
-                    context_content=self.context_content
                 )
-            
-            if alignment_result is None:
-                logger.warning("Context alignment checker returned None")
-                return None
-                
-            alignment_type = getattr(alignment_result, 'alignment_type', 'UNKNOWN')
-            is_substantial_deviation = getattr(alignment_result, 'is_substantial_deviation', False)
-            
-            # Apply strictness levels
-            should_flag_mismatch = False
-            should_flag_weak_alignment = False
-            
-            if self.context_strictness == "strict":
-                # Only DIRECT alignment is acceptable
-                should_flag_mismatch = alignment_type in ["TANGENTIAL", "UNRELATED"]
-                should_flag_weak_alignment = alignment_type == "EXTENSION"
-            elif self.context_strictness == "normal":
-                # DIRECT and EXTENSION are acceptable
-                should_flag_mismatch = alignment_type == "UNRELATED"
-                should_flag_weak_alignment = alignment_type == "TANGENTIAL"
-            else:  # lenient
-                # DIRECT, EXTENSION, and TANGENTIAL are acceptable
-                should_flag_mismatch = alignment_type == "UNRELATED"
-                should_flag_weak_alignment = False
-            
-            return {
-                'alignment_type': alignment_type,
-                'is_substantial_deviation': is_substantial_deviation,
-                'should_flag_mismatch': should_flag_mismatch,
-                'should_flag_weak_alignment': should_flag_weak_alignment,
-                'reasoning': getattr(alignment_result, 'reasoning', ''),
-                'context_topics': getattr(alignment_result, 'context_topics', []),
-                'question_topics': getattr(alignment_result, 'question_topics', []),
-                'suggestions': getattr(alignment_result, 'suggestions', [])
-            }
-            
+            return self._alignment_details(alignment_result)
+        except Exception as e:
+            logger.error(f"Error checking context alignment: {e}")
+            return None
+
+    async def _acheck_context_alignment(self, question: QuizQuestion) -> Optional[Dict[str, Any]]:
+        """Async variant of _check_context_alignment."""
+        import dspy
+
+        if not self.context_content:
+            logger.debug("No context content available, skipping alignment check")
+            return None
+
+        try:
+            logger.debug(f"Checking context alignment for question {question.number}")
+            with dspy.context(lm=self.lm):
+                alignment_result = await self._acall(
+                    self.context_alignment_checker,
+                    question=question.question,
+                    answer=question.answer,
+                )
+            return self._alignment_details(alignment_result)
         except Exception as e:
             logger.error(f"Error checking context alignment: {e}")
             return None
 
+    def _alignment_details(self, alignment_result: Any) -> Optional[Dict[str, Any]]:
+        """Apply the configured strictness to a context alignment prediction."""
+        if alignment_result is None:
+            logger.warning("Context alignment checker returned None")
+            return None
+            
+        alignment_type = getattr(alignment_result, 'alignment_type', 'UNKNOWN')
+        is_substantial_deviation = getattr(alignment_result, 'is_substantial_deviation', False)
+        
+        # Apply strictness levels
+        should_flag_mismatch = False
+        should_flag_weak_alignment = False
+        
+        if self.context_strictness == "strict":
+            # Only DIRECT alignment is acceptable
+            should_flag_mismatch = alignment_type in ["TANGENTIAL", "UNRELATED"]
+            should_flag_weak_alignment = alignment_type == "EXTENSION"
+        elif self.context_strictness == "normal":
+            # DIRECT and EXTENSION are acceptable
+            should_flag_mismatch = alignment_type == "UNRELATED"
+            should_flag_weak_alignment = alignment_type == "TANGENTIAL"
+        else:  # lenient
+            # DIRECT, EXTENSION, and TANGENTIAL are acceptable
+            should_flag_mismatch = alignment_type == "UNRELATED"
+            should_flag_weak_alignment = False
+        
+        return {
+            'alignment_type': alignment_type,
+            'is_substantial_deviation': is_substantial_deviation,
+            'should_flag_mismatch': should_flag_mismatch,
+            'should_flag_weak_alignment': should_flag_weak_alignment,
+            'reasoning': getattr(alignment_result, 'reasoning', ''),
+            'context_topics': getattr(alignment_result, 'context_topics', []),
+            'question_topics': getattr(alignment_result, 'question_topics', []),
+            'suggestions': getattr(alignment_result, 'suggestions', [])
+        }
+
     def _validate_question_similarity(self, questions: List[QuizQuestion]) -> Dict[str, Any]:
         """Validate questions for similarity and overlap."""
+        import dspy
+
         if len(questions) <= 1:
             return {
                 'has_issues': False,
@@ -351,6 +599,8 @@ class DSPyQuizChallenge:
         self, question_results: List[QuizResult], similarity_analysis: Dict[str, Any]
     ) -> None:
         """Apply similarity issues to individual question results."""
+        ValidationIssue = _signatures().ValidationIssue
+
         if similarity_analysis is None:
             logger.warning("Similarity analysis is None, skipping issue application")
             return
@@ -396,6 +646,11 @@ class DSPyQuizChallenge:
 
     def load_quiz_from_file(self, quiz_file: Path) -> List[QuizQuestion]:
         """Load quiz from TOML file."""
+        try:
+            import tomllib  # Python 3.11+
+        except ImportError:
+            import tomli as tomllib  # Fallback for Python < 3.11
+
         try:
             with open(quiz_file, "rb") as f:
                 quiz_data = tomllib.load(f)
@@ -444,6 +699,8 @@ class DSPyQuizChallenge:
         evaluation_result: Optional[Any] = None,
     ) -> RevisionGuidance:
         """Generate detailed revision guidance for a student's question."""
+        import dspy
+
         try:
             context_topics = self._extract_context_topics()
 
@@ -498,12 +755,630 @@ class DSPyQuizChallenge:
                 clarity_improvements=["Make the question more precise and specific", "Avoid ambiguous wording"],
             )
 
+    def _apply_validation(
+        self, question: QuizQuestion, validation: Any, alignment_info: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[QuizResult], List[str]]:
+        """Merge validation and context alignment outcomes for a question.
+
+        Returns:
+            Tuple of (rejection result or None if the question is valid, validation_issue_values)
+        """
+        ValidationIssue = _signatures().ValidationIssue
+
+        # Merge alignment issues with validation issues
+        is_valid = getattr(validation, 'is_valid', False)
+        issues = list(getattr(validation, 'issues', []))
+
+        # Add alignment-based issues if needed
+        if alignment_info:
+            if alignment_info['should_flag_mismatch']:
+                issues.append(ValidationIssue.CONTEXT_MISMATCH)
+                is_valid = False
+                logger.info(f"Question {question.number} flagged for context mismatch (alignment: {alignment_info['alignment_type']})")
+            elif alignment_info['should_flag_weak_alignment']:
+                issues.append(ValidationIssue.WEAK_CONTEXT_ALIGNMENT)
+                # Don't invalidate for weak alignment, just flag it
+                logger.info(f"Question {question.number} flagged for weak context alignment (alignment: {alignment_info['alignment_type']})")
+
+        if is_valid:
+            return None, []
+
+        reason = getattr(validation, 'reason', 'Unknown validation error')
+
+        # Add alignment reasoning if it was the cause
+        if alignment_info and alignment_info['should_flag_mismatch']:
+            reason = f"Context mismatch ({alignment_info['alignment_type']}): {alignment_info['reasoning']}"
+
+        logger.warning(
+            f"Student's question {question.number} failed validation: {reason}"
+        )
+        issue_values = [issue.value if hasattr(issue, 'value') else str(issue) for issue in issues]
+
+        # Include alignment suggestions if available
+        improvement_suggestions = list(getattr(validation, 'revision_suggestions', []))
+        if alignment_info and alignment_info.get('suggestions'):
+            improvement_suggestions.extend(alignment_info['suggestions'])
+
+        result = _make_result(
+            question,
+            llm_answer="Question rejected during validation",
+            explanation=f"Invalid student question: {reason}",
+            issues=issue_values,
+            error=reason,
+            difficulty_assessment=getattr(validation, 'difficulty_assessment', 'APPROPRIATE'),
+            improvement_suggestions=improvement_suggestions,
+            clarity_score=getattr(validation, 'clarity_score', None),
+        )
+        return result, issue_values
+
+    def _apply_evaluation(
+        self,
+        question: QuizQuestion,
+        validation: Any,
+        llm_answer: str,
+        evaluation: Any,
+        alignment_info: Optional[Dict[str, Any]],
+    ) -> QuizResult:
+        """Build the result for a valid question from the evaluator's verdict."""
+        ValidationIssue = _signatures().ValidationIssue
+
+        verdict = getattr(evaluation, 'verdict', 'INCORRECT')
+        student_answer_correctness = getattr(evaluation, 'student_answer_correctness', 'CORRECT')
+        student_won_this_question = getattr(evaluation, 'student_wins', False)
+        factual_issues = getattr(evaluation, 'factual_issues', [])
+
+        # Apply fact-checking logic if enabled
+        if self.verify_student_answers:
+            # Student can only win if their answer is correct
+            if student_answer_correctness != 'CORRECT':
+                student_won_this_question = False
+                logger.info(f"Question {question.number}: Student's answer is {student_answer_correctness}, cannot win")
+                if factual_issues:
+                    logger.info(f"Factual issues found: {', '.join(factual_issues)}")
+
+        logger.debug(
+            f"Evaluation: LLM verdict={verdict}, student_answer={student_answer_correctness}, student_wins={student_won_this_question}"
+        )
+
+        # Include any non-blocking alignment issues
+        non_blocking_issues = []
+        if alignment_info and alignment_info.get('should_flag_weak_alignment'):
+            non_blocking_issues.append(ValidationIssue.WEAK_CONTEXT_ALIGNMENT.value)
+
+        return _make_result(
+            question,
+            llm_answer=llm_answer,
+            is_valid=True,
+            student_wins=student_won_this_question,
+            explanation=getattr(evaluation, 'explanation', 'No explanation available'),
+            issues=non_blocking_issues,
+            difficulty_assessment=getattr(validation, 'difficulty_assessment', 'APPROPRIATE'),
+            improvement_suggestions=getattr(evaluation, 'improvement_suggestions', []),
+            clarity_score=getattr(validation, 'clarity_score', None),
+            student_answer_correctness=student_answer_correctness,
+            factual_issues=factual_issues,
+        )
+
+    def _describe_outcome(self, result: QuizResult) -> str:
+        """Short progress-bar label for a finished valid question."""
+        if result.student_wins:
+            return "Complete - Student wins!"
+        if result.student_answer_correctness != 'CORRECT' and self.verify_student_answers:
+            # Student's answer is incorrect - neither wins
+            return "Complete - Student answer incorrect"
+        return "Complete - LLM wins"
+
+    async def _acall(self, predictor: Any, **inputs: Any) -> Any:
+        """Await a predictor call within the LLM request limit, retrying 429s and 5xx errors.
+
+        The request slot is released while backing off, so one rate-limited call does not
+        hold back the others. LiteLLM's own retries are turned off for these calls, since
+        they would back off while holding the slot.
+        """
+        import dspy
+        import litellm
+        from tenacity import (
+            AsyncRetrying,
+            retry_if_exception_type,
+            stop_after_attempt,
+            wait_exponential_jitter,
+        )
+
+        def log_retry(retry_state: Any) -> None:
+            error = retry_state.outcome.exception()
+            if isinstance(error, litellm.RateLimitError):
+                self._rate_limited += 1
+            logger.warning(
+                f"LLM request failed ({type(error).__name__}), retrying in "
+                f"{retry_state.next_action.sleep:.1f}s (attempt {retry_state.attempt_number})"
+            )
+
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception_type(
+                (
+                    litellm.RateLimitError,
+                    litellm.InternalServerError,
+                    litellm.ServiceUnavailableError,
+                    litellm.APIConnectionError,
+                    litellm.APIError,
+                )
+            ),
+            wait=wait_exponential_jitter(initial=1, max=30),
+            stop=stop_after_attempt(5),
+            before_sleep=log_retry,
+            reraise=True,
+        ):
+            with attempt:
+                async with self._llm_semaphore:
+                    with dspy.context(lm=self._without_retries(dspy.settings.lm)):
+                        return await predictor.acall(**inputs)
+
+    def _without_retries(self, lm: Any) -> Any:
+        """Copy of lm with LiteLLM retries disabled, made once per LM."""
+        if lm is None:
+            return None
+        entry = self._no_retry_lms.get(id(lm))
+        if entry is None or entry[0] is not lm:
+            entry = (lm, lm.copy(num_retries=0))
+            self._no_retry_lms[id(lm)] = entry
+        return entry[1]
+
+    async def _acached_predict(
+        self, predictor: Any, key_parts: Tuple[str, ...], **inputs: Any
+    ) -> Any:
+        """Call an evaluator-model predictor, reusing a cached HIGH-confidence result.
+
+        Lower-confidence results are never stored, so borderline cases are always re-judged.
+        """
+        import dspy
+
+        key = None
+        if self.validation_cache is not None:
+            key = self.validation_cache.key(
+                self.evaluator_model, _signature_hash(predictor.signature), *key_parts
+            )
+            cached = self.validation_cache.get(key)
+            if cached is not None:
+                return dspy.Prediction(**cached)
+
+        with dspy.context(lm=self.lm):
+            prediction = await self._acall(predictor, **inputs)
+
+        if key is not None and prediction is not None and getattr(prediction, 'confidence', None) == "HIGH":
+            self.validation_cache.set(key, dict(prediction.items()))
+        return prediction
+
+    async def _aprocess_one(
+        self, question: QuizQuestion, pbar: tqdm, stop: Optional[asyncio.Event] = None
+    ) -> Tuple[QuizResult, bool, bool, List[str]]:
+        """Validate, answer, and evaluate a single student question.
+
+        Args:
+            stop: When set by another question's task, the question is abandoned before its next LLM call
+
+        Returns:
+            Tuple of (result, is_valid, student_wins, validation_issue_values)
+        """
+        import dspy
+
+        logger.info(f"Processing question {question.number}: {question.question[:50]}...")
+
+        # Each question has: validate -> skip guidance -> LLM answer -> evaluate -> finalize
+        steps_done = 0
+
+        def stopped() -> bool:
+            if stop is None or not stop.is_set():
+                return False
+            pbar.update(5 - steps_done)
+            return True
+
+        try:
+            if stopped():
+                return self._skipped_result(question), False, False, []
+
+            # Step 0.5: Check context alignment first (if context is available)
+            alignment_info = None
+            if self.context_content:
+                pbar.set_description(f"Q{question.number}: Checking context alignment")
+                alignment_info = await self._acheck_context_alignment(question)
+                if alignment_info:
+                    logger.debug(
+                        f"Context alignment: type={alignment_info['alignment_type']}, "
+                        f"flag_mismatch={alignment_info['should_flag_mismatch']}, "
+                        f"flag_weak={alignment_info['should_flag_weak_alignment']}"
+                    )
+
+            # Step 1: Validate the student's question using DSPy
+            pbar.set_description(f"Q{question.number}: Validating question")
+            logger.debug(f"Validating student's question {question.number} with DSPy...")
+            validation = await self._acached_predict(
+                self.question_validator,
+                ("validate", self._context_hash, question.question, question.answer),
+                question=question.question,
+                answer=question.answer,
+            )
+
+            # Check if validation result is None
+            if validation is None:
+                raise ValueError("Question validator returned None")
+
+            logger.debug(
+                f"Validation result: valid={getattr(validation, 'is_valid', False)}, reason={getattr(validation, 'reason', 'Unknown')}"
+            )
+            pbar.update(1)  # Step 1 complete
+            steps_done += 1
+
+            # Step 2: Skip revision guidance generation (not needed)
+            pbar.set_description(f"Q{question.number}: Skipping guidance")
+            pbar.update(1)  # Step 2 complete
+            steps_done += 1
+
+            rejected, issue_values = self._apply_validation(question, validation, alignment_info)
+            if rejected is not None:
+                pbar.set_description(f"Q{question.number}: Question invalid, skipping")
+                # Skip remaining 3 steps for invalid questions
+                pbar.update(3)
+                return rejected, False, False, issue_values
+
+            if stopped():
+                return self._skipped_result(question), False, False, []
+
+            # Step 3: LLM attempts to answer the student's question using DSPy
+            # We need to switch to the quiz model for this step
+            pbar.set_description(f"Q{question.number}: LLM taking quiz")
+            logger.debug(
+                f"LLM attempting to answer student's question {question.number} using {self.quiz_model}..."
+            )
+            with dspy.context(lm=self.quiz_lm):
+                llm_response = await self._acall(self.question_answerer, question=question.question)
+
+            # Check if llm_response is None
+            if llm_response is None:
+                raise ValueError("Question answerer returned None")
+
+            llm_answer = getattr(llm_response, 'answer', 'Unable to generate answer')
+            logger.debug(f"LLM's answer: {llm_answer[:100]}...")
+            pbar.update(1)  # Step 3 complete
+            steps_done += 1
+
+            if stopped():
+                return self._skipped_result(question), False, False, []
+
+            # Step 4: Evaluate LLM's answer against student's correct answer using DSPy
+            pbar.set_description(f"Q{question.number}: Evaluating LLM answer")
+            logger.debug(f"Evaluating LLM's answer for question {question.number}...")
+            evaluation = await self._acached_predict(
+                self.answer_evaluator,
+                ("evaluate", question.question, question.answer, llm_answer),
+                question=question.question,
+                correct_answer=question.answer,
+                llm_answer=llm_answer,
+            )
+
+            # Check if evaluation is None
+            if evaluation is None:
+                raise ValueError("Answer evaluator returned None")
+
+            result = self._apply_evaluation(
+                question, validation, llm_answer, evaluation, alignment_info
+            )
+            pbar.update(1)  # Step 4 complete
+            steps_done += 1
+
+            # Step 5: Finalize results
+            pbar.set_description(f"Q{question.number}: {self._describe_outcome(result)}")
+            pbar.update(1)  # Step 5 complete
+            return result, True, result.student_wins, []
+
+        except Exception as e:
+            pbar.set_description(f"Q{question.number}: Error occurred")
+            logger.error(f"Error processing question {question.number}: {e}")
+            logger.debug(f"Full exception details:", exc_info=True)
+            result = _make_result(
+                question, llm_answer="System error", explanation=f"System error: {e}", error=str(e)
+            )
+            # Update remaining steps for error case
+            pbar.update(5 - steps_done)
+            return result, False, False, []
+
+    async def _arun_per_question(
+        self,
+        questions: List[QuizQuestion],
+        pbar: tqdm,
+        on_result: Optional[Callable[[QuizResult], None]] = None,
+        fast_fail: bool = False,
+    ) -> List[Tuple[QuizResult, bool, bool, List[str]]]:
+        """Run the per-question pipeline for every question as concurrent asyncio tasks.
+
+        Args:
+            on_result: Called with each result as soon as its question finishes
+            fast_fail: Stop grading as soon as any outcome rules out a pass; questions not
+                yet graded are returned as skipped
+        """
+        outcomes = []
+        stop = asyncio.Event()
+
+        # Questions are independent and I/O-bound; the semaphore bounds in-flight pipelines
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def run(question: QuizQuestion) -> Tuple[QuizResult, bool, bool, List[str]]:
+            async with semaphore:
+                try:
+                    outcome = await self._aprocess_one(question, pbar, stop)
+                except Exception as e:
+                    # Never let one question's failure cancel its siblings
+                    logger.error(f"Error processing question {question.number}: {e}")
+                    result = _make_result(
+                        question, llm_answer="System error", explanation=f"System error: {e}", error=str(e)
+                    )
+                    outcome = result, False, False, []
+
+                # Decide before releasing the slot, so the next queued question sees the stop
+                if fast_fail and not stop.is_set() and self._blocks_pass(outcome):
+                    logger.info(
+                        f"Question {question.number} rules out a pass, skipping remaining questions"
+                    )
+                    stop.set()
+                return outcome
+
+        # Create the tasks up front so questions start in quiz order (as_completed would
+        # schedule bare coroutines in arbitrary order). Questions still queued when fast-fail
+        # triggers bail out as soon as they start, and in-flight ones at their next step
+        tasks = [asyncio.ensure_future(run(question)) for question in questions]
+        for next_outcome in asyncio.as_completed(tasks):
+            outcomes.append(await next_outcome)
+
+            if on_result is not None:
+                on_result(outcomes[-1][0])
+
+        return outcomes
+
+    def _skipped_result(self, question: QuizQuestion) -> QuizResult:
+        """Result for a question left ungraded by fast-fail."""
+        return _make_result(
+            question,
+            llm_answer="Not graded",
+            explanation="Skipped: an earlier question already ruled out passing the challenge",
+            error=SKIPPED_FAST_FAIL,
+        )
+
+    def _blocks_pass(self, outcome: Tuple[QuizResult, bool, bool, List[str]]) -> bool:
+        """Whether a single outcome makes passing the challenge impossible.
+
+        Passing requires every question to be valid and the student to win every
+        evaluated question, so one invalid question or one LLM win is decisive.
+        """
+        result, is_valid, student_won, _ = outcome
+        if not is_valid:
+            return True
+        if student_won:
+            return False
+        # A factually incorrect student answer is a draw, not an LLM win
+        return not (
+            self.verify_student_answers and result.student_answer_correctness != 'CORRECT'
+        )
+
+    @staticmethod
+    def _indexed(values: List[str]) -> List[str]:
+        """Prefix each batch entry with its [index] so outputs stay aligned with inputs."""
+        return [f"[{i}] {value}" for i, value in enumerate(values, 1)]
+
+    def _run_batched(
+        self, questions: List[QuizQuestion], pbar: tqdm, fast_fail: bool = False
+    ) -> Optional[List[Tuple[QuizResult, bool, bool, List[str]]]]:
+        """Run validation, answering, and evaluation as one batched LLM call each.
+
+        Args:
+            fast_fail: Skip answering and evaluation when any question fails validation
+
+        Returns:
+            Per-question outcomes, or None if any batch response did not line up with
+            its inputs and the caller should fall back to per-question calls.
+        """
+        import dspy
+
+        alignments: List[Optional[Dict[str, Any]]] = [None] * len(questions)
+        if self.context_content:
+            pbar.set_description("Checking context alignment")
+            max_workers = max(1, min(self.max_concurrency, len(questions)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                alignments = list(executor.map(self._check_context_alignment, questions))
+
+        # Step 1: Validate all questions in a single call
+        pbar.set_description("Validating questions (batched)")
+        with dspy.context(lm=self.lm):
+            batch_validation = self.batch_validator(
+                questions=self._indexed([q.question for q in questions]),
+                answers=self._indexed([q.answer for q in questions]),
+            )
+        if batch_validation is None:
+            raise ValueError("Batch question validator returned None")
+
+        # Batch output list -> the matching ValidateQuestion field
+        validation_fields = {
+            'is_valid': 'is_valid',
+            'issues': 'issues',
+            'confidences': 'confidence',
+            'reasons': 'reason',
+            'revision_suggestions': 'revision_suggestions',
+            'difficulty_assessments': 'difficulty_assessment',
+            'clarity_scores': 'clarity_score',
+        }
+        fields = {name: list(getattr(batch_validation, name, [])) for name in validation_fields}
+        if any(len(values) != len(questions) for values in fields.values()):
+            logger.warning("Batch validation did not return one entry per question")
+            return None
+
+        outcomes: Dict[int, Tuple[QuizResult, bool, bool, List[str]]] = {}
+        accepted = []
+        for i, question in enumerate(questions):
+            validation = dspy.Prediction(
+                **{field: fields[name][i] for name, field in validation_fields.items()}
+            )
+            rejected, issue_values = self._apply_validation(question, validation, alignments[i])
+            if rejected is not None:
+                outcomes[i] = (rejected, False, False, issue_values)
+            else:
+                accepted.append((i, question, validation))
+        # Validate + skip guidance for every question, plus the skipped steps of invalid ones
+        pbar.update(2 * len(questions) + 3 * (len(questions) - len(accepted)))
+
+        if fast_fail and accepted and len(accepted) < len(questions):
+            logger.info("Invalid question rules out a pass, skipping answering and evaluation")
+            for i, question, _ in accepted:
+                outcomes[i] = (self._skipped_result(question), False, False, [])
+            pbar.update(3 * len(accepted))
+            accepted = []
+
+        if accepted:
+            # Step 3: The quiz model answers all valid questions in a single call
+            pbar.set_description("LLM taking quiz (batched)")
+            with dspy.context(lm=self.quiz_lm):
+                batch_response = self.batch_answerer(
+                    questions=self._indexed([q.question for _, q, _ in accepted]),
+                )
+            if batch_response is None:
+                raise ValueError("Batch question answerer returned None")
+
+            llm_answers = list(getattr(batch_response, 'answers', []))
+            if len(llm_answers) != len(accepted):
+                logger.warning(
+                    f"Batch answering returned {len(llm_answers)} answers for {len(accepted)} questions"
+                )
+                return None
+            pbar.update(len(accepted))
+
+            # Step 4: Evaluate all answers in a single call
+            pbar.set_description("Evaluating LLM answers (batched)")
+            with dspy.context(lm=self.lm):
+                batch_evaluation = self.batch_evaluator(
+                    questions=self._indexed([q.question for _, q, _ in accepted]),
+                    correct_answers=self._indexed([q.answer for _, q, _ in accepted]),
+                    llm_answers=self._indexed(llm_answers),
+                )
+            if batch_evaluation is None:
+                raise ValueError("Batch answer evaluator returned None")
+
+            # Batch output list -> the matching EvaluateAnswer field
+            evaluation_fields = {
+                'verdicts': 'verdict',
+                'student_answer_correctness': 'student_answer_correctness',
+                'student_wins': 'student_wins',
+                'explanations': 'explanation',
+                'confidences': 'confidence',
+                'factual_issues': 'factual_issues',
+                'improvement_suggestions': 'improvement_suggestions',
+            }
+            fields = {name: list(getattr(batch_evaluation, name, [])) for name in evaluation_fields}
+            if any(len(values) != len(accepted) for values in fields.values()):
+                logger.warning("Batch evaluation did not return one entry per question")
+                return None
+
+            for j, (i, question, validation) in enumerate(accepted):
+                evaluation = dspy.Prediction(
+                    **{field: fields[name][j] for name, field in evaluation_fields.items()}
+                )
+                result = self._apply_evaluation(
+                    question, validation, llm_answers[j], evaluation, alignments[i]
+                )
+                outcomes[i] = (result, True, result.student_wins, [])
+            pbar.update(2 * len(accepted))
+
+        return [outcomes[i] for i in range(len(questions))]
+
+    def _load_partial_results(
+        self, partial_output: Path, questions: List[QuizQuestion]
+    ) -> Dict[int, QuizResult]:
+        """Load results streamed by a previous run, keyed by question number.
+
+        Only entries whose question text and answer still match the current quiz are
+        reused, so editing a question forces it to be graded again.
+        """
+        current = {q.number: q for q in questions}
+        completed = {}
+        with open(partial_output, "r") as f:
+            lines = f.read().splitlines(keepends=True)
+
+        if lines and not lines[-1].endswith("\n"):
+            # Terminate a line truncated by a crash so new results start on a fresh line
+            with open(partial_output, "a") as f:
+                f.write("\n")
+
+        for line in lines:
+            try:
+                result = _quiz_result_from_dict(json.loads(line))
+            except (ValueError, TypeError, KeyError) as e:
+                # A crash mid-write can leave a truncated final line
+                logger.warning(f"Skipping unreadable line in {partial_output}: {e}")
+                continue
+            if current.get(result.question.number) == result.question:
+                completed[result.question.number] = result
+        return completed
+
+    def _append_partial_result(self, partial_output: Path, result: QuizResult) -> None:
+        """Append one finished result to the JSON-lines sidecar file.
+
+        Failing to record a result (e.g. a full disk) is logged rather than raised, so it
+        never interrupts grading; the question is simply graded again on resume.
+        """
+        if result.llm_answer == "System error" or result.error == SKIPPED_FAST_FAIL:
+            # Leave transient failures and skipped questions out so a resumed run grades them
+            return
+        try:
+            line = json.dumps(asdict(result)) + "\n"
+            with self._partial_output_lock:
+                with open(partial_output, "a") as f:
+                    f.write(line)
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(
+                f"Could not record question {result.question.number} in {partial_output}: {e}"
+            )
+
     def run_quiz_challenge(
-        self, questions: List[QuizQuestion], quiz_title: str = "Quiz Challenge"
+        self,
+        questions: List[QuizQuestion],
+        quiz_title: str = "Quiz Challenge",
+        partial_output: Optional[Path] = None,
+        fast_fail: bool = True,
     ) -> QuizResults:
-        """Run the complete quiz challenge using DSPy structured output."""
+        """Run the complete quiz challenge; synchronous wrapper around arun_quiz_challenge."""
+        return _run_sync(
+            self.arun_quiz_challenge(
+                questions, quiz_title=quiz_title, partial_output=partial_output, fast_fail=fast_fail
+            )
+        )
+
+    async def arun_quiz_challenge(
+        self,
+        questions: List[QuizQuestion],
+        quiz_title: str = "Quiz Challenge",
+        partial_output: Optional[Path] = None,
+        fast_fail: bool = True,
+    ) -> QuizResults:
+        """Run the complete quiz challenge using DSPy structured output.
+
+        Each question's validate -> answer -> evaluate chain runs as its own asyncio task
+        on DSPy's native async predictors, so up to max_concurrency chains interleave on
+        one event loop.
+
+        Args:
+            questions: Student questions to grade
+            quiz_title: Title recorded in the results
+            partial_output: Optional JSON-lines file that receives each question result as
+                soon as it completes. If the file already exists, questions recorded in it
+                are not graded again, so an interrupted run can be resumed.
+            fast_fail: Stop grading once one question makes passing impossible (an invalid
+                question or an LLM win). Ungraded questions are reported as skipped.
+        """
+        import dspy
+        ValidationIssue = _signatures().ValidationIssue
+
         logger.info(f"Starting DSPy quiz challenge with {len(questions)} questions")
 
+        # Bound in-flight LLM requests independently of how many questions run at once
+        self._llm_semaphore = asyncio.Semaphore(max(1, self.max_llm_requests))
+        self._rate_limited = 0
+
         # Step 1: Validate question similarity first
         logger.info("Validating question similarity and overlap...")
         # Skip similarity analysis for single questions to avoid NoneType errors
@@ -541,6 +1416,8 @@ class DSPyQuizChallenge:
 
         question_results = []
         valid_count = 0
+        skipped_count = 0
+        stopped_at = None
         student_wins = 0
         llm_wins = 0
         all_validation_issues = []
@@ -555,209 +1432,82 @@ class DSPyQuizChallenge:
         pbar.set_description("Similarity validation complete")
         pbar.update(1)
 
-        for question in questions:
-            logger.info(f"Processing question {question.number}: {question.question[:50]}...")
-
-            try:
-                # Step 0.5: Check context alignment first (if context is available)
-                alignment_info = None
-                if self.context_content:
-                    pbar.set_description(f"Q{question.number}: Checking context alignment")
-                    alignment_info = self._check_context_alignment(question)
-                    if alignment_info:
-                        logger.debug(
-                            f"Context alignment: type={alignment_info['alignment_type']}, "
-                            f"flag_mismatch={alignment_info['should_flag_mismatch']}, "
-                            f"flag_weak={alignment_info['should_flag_weak_alignment']}"
-                        )
-                
-                # Step 1: Validate the student's question using DSPy
-                pbar.set_description(f"Q{question.number}: Validating question")
-                logger.debug(f"Validating student's question {question.number} with DSPy...")
-                with dspy.context(lm=self.lm):
-                    validation = self.question_validator(
-                        question=question.question,
-                        answer=question.answer,
-                        context_content=self.context_content,
-                    )
-
-                # Check if validation result is None
-                if validation is None:
-                    raise ValueError("Question validator returned None")
-
-                logger.debug(
-                    f"Validation result: valid={getattr(validation, 'is_valid', False)}, reason={getattr(validation, 'reason', 'Unknown')}"
-                )
-                pbar.update(1)  # Step 1 complete
-
-                # Step 2: Skip revision guidance generation (not needed)
-                pbar.set_description(f"Q{question.number}: Skipping guidance")
-                revision_guidance = None
-                pbar.update(1)  # Step 2 complete
-
-                # Merge alignment issues with validation issues
-                is_valid = getattr(validation, 'is_valid', False)
-                issues = list(getattr(validation, 'issues', []))
-                
-                # Add alignment-based issues if needed
-                if alignment_info:
-                    if alignment_info['should_flag_mismatch']:
-                        issues.append(ValidationIssue.CONTEXT_MISMATCH)
-                        is_valid = False
-                        logger.info(f"Question {question.number} flagged for context mismatch (alignment: {alignment_info['alignment_type']})")
-                    elif alignment_info['should_flag_weak_alignment']:
-                        issues.append(ValidationIssue.WEAK_CONTEXT_ALIGNMENT)
-                        # Don't invalidate for weak alignment, just flag it
-                        logger.info(f"Question {question.number} flagged for weak context alignment (alignment: {alignment_info['alignment_type']})")
-                
-                if not is_valid:
-                    pbar.set_description(f"Q{question.number}: Question invalid, skipping")
-                    reason = getattr(validation, 'reason', 'Unknown validation error')
-                    
-                    # Add alignment reasoning if it was the cause
-                    if alignment_info and alignment_info['should_flag_mismatch']:
-                        reason = f"Context mismatch ({alignment_info['alignment_type']}): {alignment_info['reasoning']}"
-                    
-                    logger.warning(
-                        f"Student's question {question.number} failed validation: {reason}"
-                    )
-                    all_validation_issues.extend([issue.value if hasattr(issue, 'value') else str(issue) for issue in issues])
-
-                    # Include alignment suggestions if available
-                    improvement_suggestions = list(getattr(validation, 'revision_suggestions', []))
-                    if alignment_info and alignment_info.get('suggestions'):
-                        improvement_suggestions.extend(alignment_info['suggestions'])
-                    
-                    result = QuizResult(
-                        question=question,
-                        llm_answer="Question rejected during validation",
-                        is_valid=False,
-                        student_wins=False,
-                        evaluation_explanation=f"Invalid student question: {reason}",
-                        validation_issues=[issue.value if hasattr(issue, 'value') else str(issue) for issue in issues],
-                        revision_guidance=revision_guidance,
-                        difficulty_assessment=getattr(validation, 'difficulty_assessment', 'APPROPRIATE'),
-                        improvement_suggestions=improvement_suggestions,
-                        clarity_score=getattr(validation, 'clarity_score', None),
-                        error=reason,
-                    )
-                    question_results.append(result)
-                    # Skip remaining 3 steps for invalid questions
-                    pbar.update(3)
-                    continue
-
-                valid_count += 1
-
-                # Step 3: LLM attempts to answer the student's question using DSPy
-                # We need to switch to the quiz model for this step
-                pbar.set_description(f"Q{question.number}: LLM taking quiz")
-                logger.debug(
-                    f"LLM attempting to answer student's question {question.number} using {self.quiz_model}..."
-                )
-                with dspy.context(
-                    lm=dspy.LM(model=self.quiz_model, api_base=self.base_url, api_key=self.api_key)
-                ):
-                    llm_response = self.question_answerer(
-                        question=question.question, context_content=self.context_content
-                    )
-
-                # Check if llm_response is None
-                if llm_response is None:
-                    raise ValueError("Question answerer returned None")
-
-                llm_answer = getattr(llm_response, 'answer', 'Unable to generate answer')
-                logger.debug(f"LLM's answer: {llm_answer[:100]}...")
-                pbar.update(1)  # Step 3 complete
-
-                # Step 4: Evaluate LLM's answer against student's correct answer using DSPy
-                pbar.set_description(f"Q{question.number}: Evaluating LLM answer")
-                logger.debug(f"Evaluating LLM's answer for question {question.number}...")
-                with dspy.context(lm=self.lm):
-                    evaluation = self.answer_evaluator(
-                        question=question.question,
-                        correct_answer=question.answer,
-                        llm_answer=llm_answer,
+        # Resume from results streamed by an earlier, interrupted run
+        resumed = []
+        pending = questions
+        on_result = None
+        if partial_output is not None:
+            partial_output = Path(partial_output)
+            if partial_output.exists():
+                completed = self._load_partial_results(partial_output, questions)
+                if completed:
+                    logger.info(
+                        f"Resuming from {partial_output}: {len(completed)} question(s) already graded"
                     )
-
-                # Check if evaluation is None
-                if evaluation is None:
-                    raise ValueError("Answer evaluator returned None")
-
-                verdict = getattr(evaluation, 'verdict', 'INCORRECT')
-                student_answer_correctness = getattr(evaluation, 'student_answer_correctness', 'CORRECT')
-                student_won_this_question = getattr(evaluation, 'student_wins', False)
-                factual_issues = getattr(evaluation, 'factual_issues', [])
-                
-                # Apply fact-checking logic if enabled
-                if self.verify_student_answers:
-                    # Student can only win if their answer is correct
-                    if student_answer_correctness != 'CORRECT':
-                        student_won_this_question = False
-                        logger.info(f"Question {question.number}: Student's answer is {student_answer_correctness}, cannot win")
-                        if factual_issues:
-                            logger.info(f"Factual issues found: {', '.join(factual_issues)}")
-                
-                logger.debug(
-                    f"Evaluation: LLM verdict={verdict}, student_answer={student_answer_correctness}, student_wins={student_won_this_question}"
-                )
-                pbar.update(1)  # Step 4 complete
-
-                # Step 5: Finalize results
-                if student_won_this_question:
-                    student_wins += 1
-                    pbar.set_description(f"Q{question.number}: Complete - Student wins!")
-                elif student_answer_correctness != 'CORRECT' and self.verify_student_answers:
-                    # Student's answer is incorrect - neither wins
-                    pbar.set_description(f"Q{question.number}: Complete - Student answer incorrect")
-                else:
-                    llm_wins += 1
-                    pbar.set_description(f"Q{question.number}: Complete - LLM wins")
-
-                # Skip revision guidance generation completely
-                revision_guidance = None
-
-                # Include any non-blocking alignment issues  
-                non_blocking_issues = []
-                if alignment_info and alignment_info.get('should_flag_weak_alignment'):
-                    non_blocking_issues.append(ValidationIssue.WEAK_CONTEXT_ALIGNMENT.value)
-                
-                result = QuizResult(
-                    question=question,
-                    llm_answer=llm_answer,
-                    is_valid=True,
-                    student_wins=student_won_this_question,
-                    evaluation_explanation=getattr(evaluation, 'explanation', 'No explanation available'),
-                    validation_issues=non_blocking_issues,
-                    revision_guidance=revision_guidance,
-                    difficulty_assessment=getattr(validation, 'difficulty_assessment', 'APPROPRIATE'),
-                    improvement_suggestions=getattr(evaluation, 'improvement_suggestions', []),
-                    clarity_score=getattr(validation, 'clarity_score', None),
-                    student_answer_correctness=student_answer_correctness,
-                    factual_issues=factual_issues,
-                )
-                question_results.append(result)
-                pbar.update(1)  # Step 5 complete
-
+                for result in completed.values():
+                    issue_values = [] if result.is_valid else list(result.validation_issues)
+                    resumed.append((result, result.is_valid, result.student_wins, issue_values))
+                pending = [q for q in questions if q.number not in completed]
+                pbar.update(5 * len(resumed))
+
+            def record_result(result: QuizResult) -> None:
+                self._append_partial_result(partial_output, result)
+
+            on_result = record_result
+
+        outcomes = None
+        if fast_fail and pending and any(self._blocks_pass(outcome) for outcome in resumed):
+            logger.info("A resumed result already rules out a pass, skipping remaining questions")
+            outcomes = [(self._skipped_result(q), False, False, []) for q in pending]
+            pbar.update(5 * len(pending))
+        if outcomes is None and self.batch_prompting and pending:
+            try:
+                outcomes = self._run_batched(pending, pbar, fast_fail=fast_fail)
             except Exception as e:
-                pbar.set_description(f"Q{question.number}: Error occurred")
-                logger.error(f"Error processing question {question.number}: {e}")
+                logger.error(f"Batched quiz processing failed: {e}")
                 logger.debug(f"Full exception details:", exc_info=True)
-                result = QuizResult(
-                    question=question,
-                    llm_answer="System error",
-                    is_valid=False,
-                    student_wins=False,
-                    evaluation_explanation=f"System error: {str(e)}",
-                    validation_issues=[],
-                    error=str(e),
-                )
-                question_results.append(result)
-                # Update remaining steps for error case
-                pbar.update(5 - (pbar.n % 5) if pbar.n % 5 != 0 else 0)
+            if outcomes is None:
+                logger.warning("Falling back to per-question calls")
+                pbar.reset(total=total_steps)
+                pbar.update(1 + 5 * len(resumed))
+            elif on_result is not None:
+                for result, _, _, _ in outcomes:
+                    on_result(result)
+        if outcomes is None:
+            outcomes = await self._arun_per_question(
+                pending, pbar, on_result=on_result, fast_fail=fast_fail
+            )
+
+        for result, is_valid, student_won, issue_values in resumed + outcomes:
+            question_results.append(result)
+            all_validation_issues.extend(issue_values)
+            if result.error == SKIPPED_FAST_FAIL:
+                skipped_count += 1
+                continue
+            if fast_fail and self._blocks_pass((result, is_valid, student_won, issue_values)):
+                number = result.question.number
+                stopped_at = number if stopped_at is None else min(stopped_at, number)
+            if not is_valid:
+                continue
+
+            valid_count += 1
+            if student_won:
+                student_wins += 1
+            elif self._blocks_pass((result, is_valid, student_won, issue_values)):
+                # Neither side wins when the student's own answer is incorrect
+                llm_wins += 1
 
         # Close the progress bar
         pbar.close()
 
+        if self._rate_limited:
+            logger.warning(
+                f"{self._rate_limited} LLM request(s) were rate limited; consider lowering max_llm_requests"
+            )
+
+        # Parallel processing completes out of order; restore the quiz order for reporting
+        question_results.sort(key=lambda r: r.question.number)
+
         # Apply similarity issues to individual questions after all processing is complete
         logger.info("Applying similarity issues to question results...")
         if similarity_analysis is not None:
@@ -772,6 +1522,7 @@ class DSPyQuizChallenge:
 
         # Calculate results
         evaluated_questions = student_wins + llm_wins
+        invalid_count = len(questions) - valid_count - skipped_count
         success_rate = student_wins / evaluated_questions if evaluated_questions > 0 else 0.0
 
         # Student passes if they win all valid questions - similarity issues are informational only
@@ -790,10 +1541,11 @@ class DSPyQuizChallenge:
             try:
                 logger.debug("Generating detailed feedback with DSPy...")
                 with dspy.context(lm=self.lm):
-                    feedback = self.feedback_generator(
+                    feedback = await self._acall(
+                        self.feedback_generator,
                         total_questions=len(questions),
                         valid_questions=valid_count,
-                        invalid_questions=len(questions) - valid_count,
+                        invalid_questions=invalid_count,
                         student_wins=student_wins,
                         llm_wins=llm_wins,
                         validation_issues=all_validation_issues,
@@ -812,7 +1564,13 @@ class DSPyQuizChallenge:
                 # Use default feedback
         else:
             # Simple feedback for fast mode
-            if evaluated_questions == 0:
+            if skipped_count:
+                feedback_summary = (
+                    f"Grading stopped at question {stopped_at}: it already rules out passing, "
+                    f"so the remaining {skipped_count} question(s) were not graded. "
+                    "Fix that question and resubmit."
+                )
+            elif evaluated_questions == 0:
                 feedback_summary = "No questions were successfully processed. Please check your quiz format and try again."
             else:
                 # Count questions with incorrect student answers
@@ -833,7 +1591,7 @@ class DSPyQuizChallenge:
             quiz_title=quiz_title,
             total_questions=len(questions),
             valid_questions=valid_count,
-            invalid_questions=len(questions) - valid_count,
+            invalid_questions=invalid_count,
             student_wins=student_wins,
             llm_wins=llm_wins,
             success_rate=success_rate,
@@ -842,14 +1600,19 @@ class DSPyQuizChallenge:
             student_passes=student_passes,
             github_classroom_result=github_classroom_result,
             similarity_analysis=similarity_analysis,  # Added similarity analysis
+            skipped_questions=skipped_count,
         )
 
     def save_results(self, results: QuizResults, output_file: Path):
         """Save quiz results to JSON file."""
         try:
             results_dict = asdict(results)
-            with open(output_file, "w") as f:
-                json.dump(results_dict, f, indent=2)
+            if orjson is not None:
+                with open(output_file, "wb") as f:
+                    f.write(orjson.dumps(results_dict, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, "w") as f:
+                    json.dump(results_dict, f, indent=2)
             logger.info(f"Results saved to {output_file}")
         except Exception as e:
             logger.error(f"Error saving results: {e}")
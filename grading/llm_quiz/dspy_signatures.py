@@ -290,3 +290,92 @@ class GenerateFeedback(dspy.Signature):
     )
     github_classroom_marker: str = dspy.OutputField(desc="GitHub Classroom result marker")
     improvement_tips: List[str] = dspy.OutputField(desc="Specific tips for improvement")
+
+
+def _batch_instructions(single: type, *rules: str) -> str:
+    """Instructions for a batch signature: the single-item criteria, then the batch format.
+
+    DSPy only sends a signature's own instructions to the LM, so the criteria are repeated
+    rather than referenced.
+    """
+    return "\n".join([single.instructions, "", "BATCH FORMAT:", *(f"- {rule}" for rule in rules)])
+
+
+class BatchValidateQuestions(dspy.Signature):
+    __doc__ = _batch_instructions(
+        ValidateQuestion,
+        "Several questions are validated at once; apply the criteria above to each entry independently",
+        "Each question and answer is prefixed with an [index] identifier",
+        "Return exactly one entry in every output list per input question, in the same [index] order",
+    )
+
+    questions: List[str] = dspy.InputField(desc="The student's quiz questions, each prefixed with [index]")
+    answers: List[str] = dspy.InputField(desc="The student's provided correct answers, each prefixed with the matching [index]")
+    context_content: Optional[str] = dspy.InputField(desc="Course context materials, if available")
+
+    is_valid: List[bool] = dspy.OutputField(desc="Whether each question is valid and acceptable, in [index] order")
+    issues: List[List[ValidationIssue]] = dspy.OutputField(
+        desc="For each question in [index] order, the list of specific validation issues found (empty list if none)"
+    )
+    confidences: List[Literal["HIGH", "MEDIUM", "LOW"]] = dspy.OutputField(
+        desc="Confidence in each validation decision, in [index] order"
+    )
+    reasons: List[str] = dspy.OutputField(desc="Brief explanation of each validation decision, in [index] order")
+    revision_suggestions: List[List[str]] = dspy.OutputField(
+        desc="For each question in [index] order, specific suggestions for improving it if invalid (empty list if none)"
+    )
+    difficulty_assessments: List[Literal["TOO_EASY", "APPROPRIATE", "TOO_HARD"]] = dspy.OutputField(
+        desc="Assessment of each question's difficulty level, in [index] order"
+    )
+    clarity_scores: List[Literal["CLEAR", "SOMEWHAT_CLEAR", "UNCLEAR"]] = dspy.OutputField(
+        desc="Assessment of each question's clarity and specificity, in [index] order"
+    )
+
+
+class BatchAnswerQuestions(dspy.Signature):
+    """LLM attempts to answer several student quiz questions using provided context materials.
+
+    Each question is prefixed with an [index] identifier; return exactly one answer per
+    question, in the same [index] order, without repeating the identifier."""
+
+    questions: List[str] = dspy.InputField(desc="The student's quiz questions for LLM to answer, each prefixed with [index]")
+    context_content: Optional[str] = dspy.InputField(desc="Course context materials for reference")
+
+    answers: List[str] = dspy.OutputField(
+        desc="Concise but thorough answer to each question (max 300 words each), in [index] order"
+    )
+
+
+class BatchEvaluateAnswers(dspy.Signature):
+    __doc__ = _batch_instructions(
+        EvaluateAnswer,
+        "Several answers are evaluated at once; apply the criteria above to each entry independently",
+        "Questions, correct answers, and LLM answers share [index] identifiers",
+        "Return exactly one entry in every output list per question, in the same [index] order",
+    )
+
+    questions: List[str] = dspy.InputField(desc="The student's quiz questions, each prefixed with [index]")
+    correct_answers: List[str] = dspy.InputField(desc="The student's provided correct answers, each prefixed with the matching [index]")
+    llm_answers: List[str] = dspy.InputField(desc="The LLM's answers, each prefixed with the matching [index]")
+
+    verdicts: List[Literal["CORRECT", "INCORRECT"]] = dspy.OutputField(
+        desc="Whether each LLM answer is factually correct, in [index] order"
+    )
+    student_answer_correctness: List[Literal["CORRECT", "INCORRECT", "PARTIALLY_CORRECT"]] = dspy.OutputField(
+        desc="Whether each student's provided answer is factually correct, in [index] order"
+    )
+    student_wins: List[bool] = dspy.OutputField(
+        desc="For each question, True if student wins (student correct AND LLM wrong), in [index] order"
+    )
+    explanations: List[str] = dspy.OutputField(
+        desc="Explanation including fact-checking of both answers for each question, in [index] order"
+    )
+    confidences: List[Literal["HIGH", "MEDIUM", "LOW"]] = dspy.OutputField(
+        desc="Confidence level in each evaluation, in [index] order"
+    )
+    factual_issues: List[List[str]] = dspy.OutputField(
+        desc="For each question in [index] order, the list of factual errors found in either answer"
+    )
+    improvement_suggestions: List[List[str]] = dspy.OutputField(
+        desc="For each question in [index] order, suggestions for improving the question or correcting misconceptions"
+    )
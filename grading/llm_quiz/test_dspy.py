@@ -4,17 +4,31 @@ Test script for DSPy implementation of LLM Quiz Challenge.
 This script tests the basic functionality without requiring real API keys.
 """
 
+import asyncio
 import logging
 import os
+import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
 # Import our modules
 sys.path.insert(0, os.path.dirname(__file__))
 
-from dspy_core import DSPyQuizChallenge, QuizQuestion
+import dspy
+
+from dspy_core import (
+    SKIPPED_FAST_FAIL,
+    DSPyQuizChallenge,
+    QuizQuestion,
+    QuizResult,
+    _signature_hash,
+    _ValidationCache,
+)
 from dspy_signatures import (
     AnswerQuizQuestion,
+    BatchEvaluateAnswers,
+    BatchValidateQuestions,
     EvaluateAnswer,
     ParseQuestionAndAnswer,
     ValidateQuestion,
@@ -102,6 +116,349 @@ def test_data_structures():
     logger.info("✓ QuizQuestion dataclass working")
 
 
+def test_lazy_imports():
+    """Test that the result dataclasses import without pulling in dspy."""
+    logger.info("Testing lazy imports...")
+
+    # Run in a fresh interpreter, since this test module already imported dspy
+    code = "import sys, dspy_core; print('dspy' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert output.strip() == "False"
+    logger.info("✓ dspy_core imports without dspy")
+
+
+def test_partial_results_resume():
+    """Test that streamed partial results can be reloaded for resuming."""
+    logger.info("Testing partial results streaming...")
+
+    challenge = DSPyQuizChallenge(
+        base_url="http://dummy.com",
+        api_key="dummy_key",
+        quiz_model="dummy_model",
+        evaluator_model="dummy_evaluator",
+        cache_dir=None,
+    )
+    questions = [
+        QuizQuestion(question="What is 2 + 2?", answer="4", number=1),
+        QuizQuestion(question="What is 3 + 3?", answer="6", number=2),
+    ]
+    graded = QuizResult(
+        question=questions[0],
+        llm_answer="4",
+        is_valid=True,
+        student_wins=False,
+        evaluation_explanation="Correct",
+        validation_issues=[],
+    )
+    failed = QuizResult(
+        question=questions[1],
+        llm_answer="System error",
+        is_valid=False,
+        student_wins=False,
+        evaluation_explanation="System error: timeout",
+        validation_issues=[],
+        error="timeout",
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        partial_output = Path(tmp_dir) / "partial.jsonl"
+        challenge._append_partial_result(partial_output, graded)
+        challenge._append_partial_result(partial_output, failed)
+
+        completed = challenge._load_partial_results(partial_output, questions)
+        assert completed == {1: graded}, "Only non-error results should be resumed"
+
+        # Edited questions must be graded again
+        edited = [QuizQuestion(question="What is 2 + 5?", answer="7", number=1)]
+        assert challenge._load_partial_results(partial_output, edited) == {}
+
+        # A result that cannot be recorded must not interrupt grading
+        challenge._append_partial_result(Path(tmp_dir) / "missing" / "partial.jsonl", graded)
+    logger.info("✓ Partial results round-trip and resume filtering working")
+
+
+def test_no_cache():
+    """Test that disabling the cache affects only the challenge's own LMs."""
+    logger.info("Testing cache_dir=None...")
+
+    global_cache = dspy.cache
+    enabled = (global_cache.enable_disk_cache, global_cache.enable_memory_cache)
+    challenge = DSPyQuizChallenge(
+        base_url="http://dummy.com",
+        api_key="dummy_key",
+        quiz_model="dummy_model",
+        evaluator_model="dummy_evaluator",
+        cache_dir=None,
+    )
+    assert challenge.lm.cache is False and challenge.quiz_lm.cache is False
+    assert challenge.validation_cache is None
+    assert dspy.cache is global_cache
+    assert (global_cache.enable_disk_cache, global_cache.enable_memory_cache) == enabled
+    logger.info("✓ cache_dir=None leaves the process-wide DSPy cache alone")
+
+
+def test_validation_cache_key():
+    """Test which differences between submissions the validation cache key ignores."""
+    logger.info("Testing validation cache keys...")
+
+    key = _ValidationCache.key
+    assert key("What is  k?", "2") == key(" What is k? ", "2"), "Whitespace should not matter"
+    assert key("What is k?", "2") != key("What is K?", "2"), "Case carries meaning"
+    assert key("P(A|B)", "x") != key("P(A", "B)|x"), "Part boundaries must stay unambiguous"
+
+    edited = ValidateQuestion.with_instructions("Reject every question.")
+    assert _signature_hash(ValidateQuestion) != _signature_hash(edited)
+    logger.info("✓ Validation cache keys normalize whitespace only")
+
+
+def test_llm_retries():
+    """Test that only _acall's requests bypass LiteLLM retries, and the request limit default."""
+    logger.info("Testing LLM retries and request limit...")
+
+    os.environ["LLM_MAX_CONCURRENCY"] = "3"
+    try:
+        challenge = DSPyQuizChallenge(
+            base_url="http://dummy.com",
+            api_key="dummy_key",
+            quiz_model="dummy_model",
+            evaluator_model="dummy_evaluator",
+            cache_dir=None,
+        )
+    finally:
+        del os.environ["LLM_MAX_CONCURRENCY"]
+    assert challenge.max_llm_requests == 3
+
+    # Synchronous calls (similarity, batching, parsing) rely on LiteLLM's retries
+    assert challenge.lm.num_retries > 0 and challenge.quiz_lm.num_retries > 0
+
+    class Recorder:
+        async def acall(self, **inputs):
+            return dspy.settings.lm
+
+    async def call():
+        challenge._llm_semaphore = asyncio.Semaphore(1)
+        with dspy.context(lm=challenge.quiz_lm):
+            return await challenge._acall(Recorder())
+
+    used_lm = asyncio.run(call())
+    assert used_lm.num_retries == 0 and used_lm.model == challenge.quiz_lm.model
+    assert asyncio.run(call()) is used_lm, "The no-retry copy should be reused"
+    logger.info("✓ Only async calls retried by tenacity bypass LiteLLM retries")
+
+
+def _stub_challenge(verdicts, **kwargs):
+    """Create a challenge whose LLM calls return canned predictions.
+
+    Args:
+        verdicts: Maps each question text to (is_valid, student_answer_correctness, student_wins)
+
+    Returns:
+        Tuple of (challenge, calls), where calls records each (stage, question) sent to the LLM
+    """
+    challenge = DSPyQuizChallenge(
+        base_url="http://dummy.com",
+        api_key="dummy_key",
+        quiz_model="dummy_model",
+        evaluator_model="dummy_evaluator",
+        cache_dir=None,
+        max_concurrency=1,  # Grade questions one at a time, in quiz order
+        **kwargs,
+    )
+    calls = []
+
+    async def acached_predict(predictor, key_parts, **inputs):
+        is_valid, correctness, student_wins = verdicts[inputs["question"]]
+        if predictor is challenge.question_validator:
+            calls.append(("validate", inputs["question"]))
+            return dspy.Prediction(is_valid=is_valid, issues=[], reason="stub")
+        calls.append(("evaluate", inputs["question"]))
+        return dspy.Prediction(
+            verdict="INCORRECT" if student_wins else "CORRECT",
+            student_answer_correctness=correctness,
+            student_wins=student_wins,
+            explanation="stub",
+            factual_issues=[],
+        )
+
+    async def acall(predictor, **inputs):
+        calls.append(("answer", inputs["question"]))
+        return dspy.Prediction(answer="stub answer")
+
+    challenge._acached_predict = acached_predict
+    challenge._acall = acall
+    challenge._validate_question_similarity = lambda questions: {"has_issues": False}
+    return challenge, calls
+
+
+def _questions(count):
+    return [QuizQuestion(question=f"Question {i}?", answer=f"Answer {i}", number=i) for i in range(1, count + 1)]
+
+
+def test_fast_fail_invalid_question():
+    """Test that an invalid question skips the questions still to be graded."""
+    logger.info("Testing fast-fail on an invalid question...")
+
+    questions = _questions(3)
+    challenge, calls = _stub_challenge(
+        {
+            "Question 1?": (False, "CORRECT", False),
+            "Question 2?": (True, "CORRECT", True),
+            "Question 3?": (True, "CORRECT", True),
+        }
+    )
+    results = challenge.run_quiz_challenge(questions)
+
+    assert calls == [("validate", "Question 1?")], "No LLM call should follow the invalid question"
+    assert [r.error for r in results.question_results[1:]] == [SKIPPED_FAST_FAIL] * 2
+    assert results.invalid_questions == 1, "Skipped questions are not invalid"
+    assert results.skipped_questions == 2
+    assert results.feedback_summary.startswith("Grading stopped at question 1")
+    assert not results.student_passes
+
+    # Without fast-fail every question is graded
+    challenge, calls = _stub_challenge(
+        {q.question: (q.number != 1, "CORRECT", True) for q in questions}
+    )
+    results = challenge.run_quiz_challenge(questions, fast_fail=False)
+    assert all(r.error != SKIPPED_FAST_FAIL for r in results.question_results)
+    assert results.skipped_questions == 0
+    assert results.student_wins == 2
+    logger.info("✓ Invalid question skips the remaining questions")
+
+
+def test_fast_fail_draw_does_not_block():
+    """Test that a factually incorrect student answer (a draw) does not stop grading."""
+    logger.info("Testing fast-fail on a draw...")
+
+    challenge, _ = _stub_challenge(
+        {
+            "Question 1?": (True, "INCORRECT", False),
+            "Question 2?": (True, "CORRECT", True),
+        }
+    )
+    results = challenge.run_quiz_challenge(_questions(2))
+
+    assert all(r.error is None for r in results.question_results), "A draw must not skip questions"
+    assert (results.student_wins, results.llm_wins) == (1, 0)
+
+    # An LLM win, on the other hand, is decisive
+    challenge, calls = _stub_challenge(
+        {
+            "Question 1?": (True, "CORRECT", False),
+            "Question 2?": (True, "CORRECT", True),
+        }
+    )
+    results = challenge.run_quiz_challenge(_questions(2))
+    assert results.question_results[1].error == SKIPPED_FAST_FAIL
+    assert ("validate", "Question 2?") not in calls
+    logger.info("✓ Draws keep grading, LLM wins stop it")
+
+
+def test_fast_fail_resumed_result():
+    """Test that a resumed result ruling out a pass skips the pending questions."""
+    logger.info("Testing fast-fail on a resumed result...")
+
+    questions = _questions(2)
+    challenge, calls = _stub_challenge({"Question 2?": (True, "CORRECT", True)})
+    invalid = QuizResult(
+        question=questions[0],
+        llm_answer="Question rejected during validation",
+        is_valid=False,
+        student_wins=False,
+        evaluation_explanation="Invalid student question: stub",
+        validation_issues=[],
+        error="stub",
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        partial_output = Path(tmp_dir) / "partial.jsonl"
+        challenge._append_partial_result(partial_output, invalid)
+        results = challenge.run_quiz_challenge(questions, partial_output=partial_output)
+
+    assert calls == [], "Pending questions should not reach the LLM"
+    assert results.question_results[0] == invalid
+    assert results.question_results[1].error == SKIPPED_FAST_FAIL
+    logger.info("✓ Blocking resumed result skips the pending questions")
+
+
+def test_run_inside_event_loop():
+    """Test that the synchronous wrapper also works from inside a running event loop."""
+    logger.info("Testing run_quiz_challenge inside a running event loop...")
+
+    challenge, _ = _stub_challenge({"Question 1?": (True, "CORRECT", True)})
+
+    async def notebook_cell():
+        # Jupyter and marimo run cells inside an event loop
+        return challenge.run_quiz_challenge(_questions(1))
+
+    results = asyncio.run(notebook_cell())
+    assert results.student_wins == 1
+    logger.info("✓ Runs inside a running event loop")
+
+
+def test_batch_mismatch_falls_back():
+    """Test that a batch response not lining up with its inputs falls back to per-question calls."""
+    logger.info("Testing batch prompting fallback...")
+
+    questions = _questions(2)
+    challenge, calls = _stub_challenge(
+        {q.question: (True, "CORRECT", True) for q in questions}, batch_prompting=True
+    )
+    # One verdict for two questions
+    challenge.batch_validator = lambda **inputs: dspy.Prediction(
+        is_valid=[True], issues=[[]], reasons=["stub"]
+    )
+    results = challenge.run_quiz_challenge(questions)
+
+    assert {question for stage, question in calls if stage == "validate"} == {"Question 1?", "Question 2?"}
+    assert results.student_passes
+    logger.info("✓ Batch length mismatch falls back to per-question calls")
+
+
+def test_batch_outputs_mapped():
+    """Test that batch prompting keeps the single-question criteria and assessment fields."""
+    logger.info("Testing batch prompting outputs...")
+
+    # The batch prompts carry the full single-question criteria
+    assert ValidateQuestion.instructions in BatchValidateQuestions.instructions
+    assert EvaluateAnswer.instructions in BatchEvaluateAnswers.instructions
+
+    questions = _questions(2)
+    challenge, calls = _stub_challenge({}, batch_prompting=True)
+    challenge.batch_validator = lambda **inputs: dspy.Prediction(
+        is_valid=[True, True],
+        issues=[[], []],
+        confidences=["HIGH", "LOW"],
+        reasons=["stub", "stub"],
+        revision_suggestions=[[], []],
+        difficulty_assessments=["TOO_EASY", "TOO_HARD"],
+        clarity_scores=["CLEAR", "UNCLEAR"],
+    )
+    challenge.batch_answerer = lambda **inputs: dspy.Prediction(answers=["a1", "a2"])
+    challenge.batch_evaluator = lambda **inputs: dspy.Prediction(
+        verdicts=["INCORRECT", "INCORRECT"],
+        student_answer_correctness=["CORRECT", "CORRECT"],
+        student_wins=[True, True],
+        explanations=["stub", "stub"],
+        confidences=["HIGH", "HIGH"],
+        factual_issues=[[], []],
+        improvement_suggestions=[["tip 1"], ["tip 2"]],
+    )
+    results = challenge.run_quiz_challenge(questions)
+
+    assert calls == [], "Batch prompting should not fall back to per-question calls"
+    assert [r.difficulty_assessment for r in results.question_results] == ["TOO_EASY", "TOO_HARD"]
+    assert [r.clarity_score for r in results.question_results] == ["CLEAR", "UNCLEAR"]
+    assert [r.improvement_suggestions for r in results.question_results] == [["tip 1"], ["tip 2"]]
+    logger.info("✓ Batch prompting maps every assessment field")
+
+
 def main():
     """Run all tests."""
     logger.info("Starting DSPy implementation tests...")
@@ -117,6 +474,39 @@ def main():
         test_quiz_loading()
         logger.info("")
 
+        test_lazy_imports()
+        logger.info("")
+
+        test_partial_results_resume()
+        logger.info("")
+
+        test_no_cache()
+        logger.info("")
+
+        test_validation_cache_key()
+        logger.info("")
+
+        test_llm_retries()
+        logger.info("")
+
+        test_fast_fail_invalid_question()
+        logger.info("")
+
+        test_fast_fail_draw_does_not_block()
+        logger.info("")
+
+        test_fast_fail_resumed_result()
+        logger.info("")
+
+        test_run_inside_event_loop()
+        logger.info("")
+
+        test_batch_mismatch_falls_back()
+        logger.info("")
+
+        test_batch_outputs_mapped()
+        logger.info("")
+
         logger.info("=" * 50)
         logger.info("✓ All basic tests passed!")
         logger.info("")
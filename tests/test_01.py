@@ -14,6 +14,7 @@
 import sys
 import os
 import igraph
+import numpy as np
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
@@ -63,36 +64,38 @@ try:
     # ------------------------------------------------------------
     # Test 4: All edges exist in the original graph
     # ------------------------------------------------------------
-    original_edges = set((e.source, e.target) for e in g.es)
-    original_edges.update((e.target, e.source) for e in g.es)  # Add reverse edges
+    edge_array = np.asarray(edge_sequence, dtype=np.int64).reshape(-1, 2)
 
-    all_exist = all((source, target) in original_edges for source, target in edge_sequence)
+    # Encode each undirected edge as one int64 key, smaller endpoint in the high bits
+    def edge_keys(edges):
+        return (edges.min(axis=1) << 32) | edges.max(axis=1)
+
+    original_keys = edge_keys(np.asarray(g.get_edgelist(), dtype=np.int64).reshape(-1, 2))
+    sequence_keys = edge_keys(edge_array)
+
+    all_exist = bool(np.isin(sequence_keys, original_keys).all())
     print(f"[Test 4] All edges exist in original graph: {all_exist}")
     assert all_exist, "All edges must exist in the original graph"
 
     # ------------------------------------------------------------
     # Test 5: No duplicate edges
     # ------------------------------------------------------------
-    edge_set = set(edge_sequence)
-    no_duplicates = len(edge_set) == len(edge_sequence)
-    print(f"[Test 5] No duplicate edges: {no_duplicates} (unique: {len(edge_set)}, total: {len(edge_sequence)})")
-    assert no_duplicates, f"Duplicate edges found. Unique: {len(edge_set)}, Total: {len(edge_sequence)}"
+    unique_edges = np.unique(sequence_keys).size
+    no_duplicates = unique_edges == len(edge_sequence)
+    print(f"[Test 5] No duplicate edges: {no_duplicates} (unique: {unique_edges}, total: {len(edge_sequence)})")
+    assert no_duplicates, f"Duplicate edges found. Unique: {unique_edges}, Total: {len(edge_sequence)}"
 
     # ------------------------------------------------------------
     # Test 6: Edges are sorted by degree product (descending order)
     # ------------------------------------------------------------
-    degrees = g.degree()
-    degree_products = []
-    for edge in edge_sequence:
-        source, target = edge
-        degree_product = degrees[source] * degrees[target]
-        degree_products.append(degree_product)
+    degrees = np.asarray(g.degree())
+    degree_products = degrees[edge_array[:, 0]] * degrees[edge_array[:, 1]]
 
     # Check if sorted in descending order
-    is_sorted = all(degree_products[i] >= degree_products[i+1] for i in range(len(degree_products)-1))
+    is_sorted = bool(np.all(np.diff(degree_products) <= 0))
     print(f"[Test 6] Edges sorted by degree product (descending): {is_sorted}")
     if not is_sorted:
-        print(f"   First 10 degree products: {degree_products[:10]}")
+        print(f"   First 10 degree products: {degree_products[:10].tolist()}")
     assert is_sorted, "Edges must be sorted by degree product (descending)"
 
     # ------------------------------------------------------------
@@ -101,10 +104,10 @@ try:
     print(f"[Test 7] Strategy analysis:")
     print(f"   Highest degree product: {degree_products[0]}")
     print(f"   Lowest degree product: {degree_products[-1]}")
-    print(f"   Average degree product: {sum(degree_products) / len(degree_products):.2f}")
+    print(f"   Average degree product: {degree_products.mean():.2f}")
 
     # First few edges should connect high-degree nodes
-    high_degree_threshold = max(degrees) * 0.7
+    high_degree_threshold = degrees.max() * 0.7
     high_degree_edges = sum(1 for i in range(min(10, len(edge_sequence)))
                            if degrees[edge_sequence[i][0]] >= high_degree_threshold or
                               degrees[edge_sequence[i][1]] >= high_degree_threshold)
@@ -16,6 +16,15 @@ import os
 import igraph
 import numpy as np
 
+# numba is optional and deliberately not a script dependency: on this network the
+# plain-Python union-find takes milliseconds, far less than a cold JIT compile
+try:
+    from numba import njit
+except ImportError:
+    # Without numba the union-find helpers run as plain Python
+    def njit(*args, **kwargs):
+        return lambda function: function
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from assignment.assignment import custom_edge_attack_sequence, degree_edge_attack_sequence
@@ -25,34 +34,96 @@ from utils import construct_london_transport_network
 graph = construct_london_transport_network()
 
 # %% Helper Functions
-def simulate_attack_effectiveness(graph, edge_sequence):
-    """Simulate attack sequence and return connectivity profile"""
-    connectivity_profile = []
-    g_copy = graph.copy()
-    total_nodes = g_copy.vcount()
-
-    # Initial connectivity
-    components = g_copy.connected_components()
-    largest_component_size = max(len(comp) for comp in components) if components else 0
-    connectivity = largest_component_size / total_nodes
-    connectivity_profile.append(connectivity)
-
-    # Remove edges one by one
+@njit(cache=True, nogil=True)
+def _find(parent, node):
+    while parent[node] != node:
+        parent[node] = parent[parent[node]]
+        node = parent[node]
+    return node
+
+
+@njit(cache=True, nogil=True)
+def _union(parent, size, source, target, largest):
+    """Merge the components of source and target; return the new largest size"""
+    root_a, root_b = _find(parent, source), _find(parent, target)
+    if root_a == root_b:
+        return largest
+    if size[root_a] < size[root_b]:
+        root_a, root_b = root_b, root_a
+    parent[root_b] = root_a
+    size[root_a] += size[root_b]
+    return max(largest, size[root_a])
+
+
+@njit(cache=True, nogil=True)
+def _largest_component_sizes(n_nodes, kept_edges, removed_edges):
+    """Largest component size after the first k removals, for every k"""
+    parent = np.arange(n_nodes)
+    size = np.ones(n_nodes, dtype=np.int64)
+    largest = 1 if n_nodes > 0 else 0
+
+    # Start from the graph with every attacked edge gone
+    for i in range(kept_edges.shape[0]):
+        largest = _union(parent, size, kept_edges[i, 0], kept_edges[i, 1], largest)
+
+    largest_after = np.empty(removed_edges.shape[0] + 1, dtype=np.int64)
+    largest_after[removed_edges.shape[0]] = largest
+    for i in range(removed_edges.shape[0] - 1, -1, -1):
+        largest = _union(parent, size, removed_edges[i, 0], removed_edges[i, 1], largest)
+        largest_after[i] = largest
+    return largest_after
+
+
+def simulate_attack_effectiveness(graph, edge_sequence, stop_below=None):
+    """Simulate attack sequence and return connectivity profile
+
+    Rather than recomputing components after every removal, the removed edges are
+    added back in reverse order to a union-find over the fully attacked graph; the
+    largest component seen after each insertion is the profile read backwards.
+
+    Returns a float64 array with one entry for the intact graph plus one per step;
+    if stop_below is given, the profile ends at the first value below it.
+    """
+    total_nodes = graph.vcount()
+    edge_array = np.asarray(graph.get_edgelist(), dtype=np.int64).reshape(-1, 2)
+
+    # Edge IDs keyed by (smaller, larger) endpoint, looked up once per attack step
+    edge_ids = {
+        (source, target) if source < target else (target, source): edge_id
+        for edge_id, (source, target) in enumerate(edge_array.tolist())
+    }
+
+    # Resolve the attack into edge removals; -1 marks a step that failed
+    removed = np.zeros(len(edge_array), dtype=bool)
+    steps = []
     for edge in edge_sequence:
         try:
-            # Find edge ID and remove
-            edge_id = g_copy.get_eid(edge[0], edge[1], error=False)
-            if edge_id != -1:
-                g_copy.delete_edges([edge_id])
-
-                # Calculate new connectivity
-                components = g_copy.connected_components()
-                largest_component_size = max(len(comp) for comp in components) if components else 0
-                connectivity = largest_component_size / total_nodes
-                connectivity_profile.append(connectivity)
+            source, target = edge[0], edge[1]
+            if not (0 <= source < total_nodes and 0 <= target < total_nodes):
+                raise ValueError(f"vertex out of range in {edge}")
+            edge_id = edge_ids.get((source, target) if source < target else (target, source), -1)
         except:
-            # Edge might not exist or already removed
-            connectivity_profile.append(connectivity_profile[-1])
+            # Edge might not exist
+            steps.append(-1)
+            continue
+        if edge_id != -1 and not removed[edge_id]:
+            removed[edge_id] = True
+            steps.append(edge_id)
+
+    steps = np.asarray(steps, dtype=np.int64)
+    is_removal = steps >= 0
+    largest_after = _largest_component_sizes(total_nodes, edge_array[~removed], edge_array[steps[is_removal]])
+
+    # A failed step repeats the previous value, which is the state after the
+    # removals made so far
+    removals_done = np.zeros(len(steps) + 1, dtype=np.int64)
+    np.cumsum(is_removal, out=removals_done[1:])
+    connectivity_profile = largest_after[removals_done] / total_nodes
+
+    if stop_below is not None:
+        below = connectivity_profile < stop_below
+        if below.any():
+            connectivity_profile = connectivity_profile[: below.argmax() + 1]
 
     return connectivity_profile
 
@@ -97,17 +168,25 @@ try:
     # ------------------------------------------------------------
     # Test 4: All edges exist in the original graph
     # ------------------------------------------------------------
-    original_edges = set((e.source, e.target) for e in graph.es)
-    original_edges.update((e.target, e.source) for e in graph.es)  # Add reverse edges
-
-    all_exist = all((source, target) in original_edges for source, target in custom_sequence)
+    # Store each undirected edge once, smaller endpoint first
+    original_edges = frozenset(
+        (source, target) if source <= target else (target, source)
+        for source, target in graph.get_edgelist()
+    )
+
+    # Canonical attack edges, shared with the duplicate check in Test 5
+    edge_set = {
+        (source, target) if source <= target else (target, source)
+        for source, target in custom_sequence
+    }
+
+    all_exist = edge_set <= original_edges
     print(f"[Test 4] All edges exist in original graph: {all_exist}")
     assert all_exist, "All edges must exist in the original graph"
 
     # ------------------------------------------------------------
     # Test 5: No duplicate edges
     # ------------------------------------------------------------
-    edge_set = set(custom_sequence)
     no_duplicates = len(edge_set) == len(custom_sequence)
     print(f"[Test 5] No duplicate edges: {no_duplicates} (unique: {len(edge_set)}, total: {len(custom_sequence)})")
     assert no_duplicates, f"Duplicate edges found. Unique: {len(edge_set)}, Total: {len(custom_sequence)}"
@@ -120,16 +199,14 @@ try:
     try:
         degree_sequence = degree_edge_attack_sequence(graph)
 
-        # Simulate both attack strategies
-        custom_profile = simulate_attack_effectiveness(graph, custom_sequence)
-        degree_profile = simulate_attack_effectiveness(graph, degree_sequence)
+        # Simulate both attack strategies; only the 50% crossing is needed
+        custom_profile = simulate_attack_effectiveness(graph, custom_sequence, stop_below=0.5)
+        degree_profile = simulate_attack_effectiveness(graph, degree_sequence, stop_below=0.5)
 
         # Find where connectivity drops below 50%
         def find_50_percent_threshold(profile):
-            for i, conn in enumerate(profile):
-                if conn < 0.5:
-                    return i
-            return len(profile)
+            below = np.asarray(profile) < 0.5
+            return int(below.argmax()) if below.any() else len(below)
 
         custom_threshold = find_50_percent_threshold(custom_profile)
         degree_threshold = find_50_percent_threshold(degree_profile)
@@ -162,18 +239,25 @@ try:
 
     # Check if using edge betweenness (common advanced strategy)
     try:
-        edge_betweenness = graph.edge_betweenness()
+        # Only the top-ranked edges matter here, so on large graphs accumulate
+        # shortest paths from a fixed random sample of sources instead of all vertices
+        betweenness_sources = None
+        if graph.vcount() > 1000:
+            rng = np.random.default_rng(0)
+            betweenness_sources = np.sort(rng.choice(graph.vcount(), size=256, replace=False)).tolist()
+        edge_betweenness = np.asarray(
+            graph.edge_betweenness(sources=betweenness_sources), dtype=np.float64
+        )
         if len(edge_betweenness) > 0:
-            # Get edges sorted by betweenness
-            edges_with_betweenness = [(graph.es[i].tuple, edge_betweenness[i])
-                                    for i in range(len(edge_betweenness))]
-            edges_with_betweenness.sort(key=lambda x: x[1], reverse=True)
+            # Edge IDs by descending betweenness; stable, so ties keep edge order
+            betweenness_order = np.argsort(-edge_betweenness, kind="stable")
+            edge_list = graph.get_edgelist()
 
             # Check correlation with custom sequence
             betweenness_matches = 0
             for i in range(min(10, len(custom_sequence))):
-                if i < len(edges_with_betweenness):
-                    expected_edge = edges_with_betweenness[i][0]
+                if i < len(betweenness_order):
+                    expected_edge = edge_list[betweenness_order[i]]
                     actual_edge = custom_sequence[i]
                     if (expected_edge == actual_edge or
                         (expected_edge[1], expected_edge[0]) == actual_edge):
@@ -6,14 +6,76 @@ for testing purposes in the network robustness assignment.
 """
 
 import igraph as ig
+import numpy as np
+import pandas as pd
 import requests
 import zipfile
 import io
-import csv
 import os
-from typing import Tuple, List, Optional
+import shutil
+import tempfile
+from functools import lru_cache
+from typing import BinaryIO, Tuple, List, Optional
 
 
+def _write_cache(cache_path: str, content: BinaryIO) -> None:
+    """
+    Store downloaded content on disk, leaving no partial file behind.
+    
+    The content is copied from the current position of the file object under a
+    temporary name and then renamed into place; the file object is rewound afterwards.
+    Failing to write the cache (e.g. a read-only home directory) is not an error.
+    """
+    start = content.tell()
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temp_path, "wb") as f:
+            shutil.copyfileobj(content, f)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not cache download at {cache_path}: {e}")
+        # Drop the partial copy, e.g. when the disk filled up mid-write
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+    finally:
+        content.seek(start)
+
+
+def _open_archive(data_url: str, cache_path: str) -> BinaryIO:
+    """
+    Open the archive at data_url as a seekable binary file, downloading it if needed.
+    
+    A cached copy is opened directly. Otherwise the response body is streamed into a
+    spooled temporary file (in memory up to 8 MB, on disk beyond that) as it arrives,
+    rather than waiting for the whole body, and then cached.
+    
+    Returns:
+        BinaryIO: File positioned at the start of the archive; the caller closes it
+    """
+    if os.path.exists(cache_path):
+        print(f"Using cached London Transport network data from {cache_path}")
+        return open(cache_path, "rb")
+    
+    print("Downloading London Transport network data...")
+    archive = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+    try:
+        with requests.get(data_url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            # Undo any transfer encoding (e.g. gzip) while copying the raw stream
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, archive)
+    except BaseException:
+        archive.close()
+        raise
+    archive.seek(0)
+    _write_cache(cache_path, archive)
+    return archive
+
+
+@lru_cache(maxsize=1)
 def construct_london_transport_network() -> ig.Graph:
     """
     Construct the London Transportation Network from the Network Repository data.
@@ -23,6 +85,11 @@ def construct_london_transport_network() -> ig.Graph:
     
     The dataset contains edges in the format: source, target, weight, layer
     This function creates an igraph Graph object with the network structure.
+    The archive is cached under $XDG_CACHE_HOME/advnetsci (default ~/.cache) and
+    only downloaded when no cached copy exists.
+    
+    The graph is built once per process and the same instance is returned on every
+    call; use construct_london_transport_network_copy() to get a graph to modify.
     
     Returns:
         ig.Graph: London Transportation Network as an igraph Graph object
@@ -37,14 +104,16 @@ def construct_london_transport_network() -> ig.Graph:
     # URL for the London Transport network data
     data_url = "https://networks.skewed.de/net/london_transport/files/london_transport.csv.zip"
     
+    # Downloaded archives are kept here so repeated test runs skip the network
+    cache_path = os.path.join(
+        os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+        "advnetsci",
+        os.path.basename(data_url),
+    )
+    
     try:
-        # Download the zip file
-        print("Downloading London Transport network data...")
-        response = requests.get(data_url, timeout=30)
-        response.raise_for_status()
-        
         # Open the zip file
-        with zipfile.ZipFile(io.BytesIO(response.content)) as zip_file:
+        with _open_archive(data_url, cache_path) as archive, zipfile.ZipFile(archive) as zip_file:
             # Look for the edges CSV file
             csv_filename = "Network Catalogue/edges.csv"
             
@@ -71,74 +140,49 @@ def construct_london_transport_network() -> ig.Graph:
             
             # Read the CSV data
             with zip_file.open(csv_filename) as csv_file:
-                # Decode bytes to string and create CSV reader
                 csv_content = csv_file.read().decode('utf-8')
-                csv_reader = csv.reader(io.StringIO(csv_content))
-                
-                # Skip header if present (check if first row contains non-numeric data)
-                edges_data = []
-                first_row = True
-                
-                for row in csv_reader:
-                    if not row or len(row) < 2:  # Skip empty rows
-                        continue
-                        
-                    # Check if first row is header
-                    if first_row:
-                        try:
-                            int(row[0])  # Try to convert first element to int
-                            first_row = False
-                        except ValueError:
-                            # First row is header, skip it
-                            first_row = False
-                            continue
-                    
-                    # Parse edge data: source, target, weight, layer
-                    try:
-                        source = int(row[0])
-                        target = int(row[1])
-                        # weight and layer are available but not needed for basic graph construction
-                        edges_data.append((source, target))
-                    except (ValueError, IndexError) as e:
-                        print(f"Warning: Skipping invalid row {row}: {e}")
-                        continue
-        
-        if not edges_data:
-            raise ValueError("No valid edges found in the dataset")
+
+        # Skip header if present (check if first field is non-numeric)
+        first_field = csv_content.lstrip().split(",", 1)[0].strip()
+        has_header = not first_field.lstrip("-").isdigit()
+
+        # Parse edge data: source, target, weight, layer
+        # weight and layer are available but not needed for basic graph construction
+        endpoints = pd.read_csv(
+            io.StringIO(csv_content),
+            header=0 if has_header else None,
+            usecols=[0, 1],
+            on_bad_lines="skip",
+        ).apply(pd.to_numeric, errors="coerce")
+        invalid = endpoints.isna().any(axis=1)
+        if invalid.any():
+            print(f"Warning: Skipping {int(invalid.sum())} invalid rows")
+        edges_data = endpoints[~invalid].to_numpy(dtype=np.int64)
         
-        # Remove duplicate edges - normalize edge direction and use set for deduplication
-        unique_edges = set()
-        for source, target in edges_data:
-            # Normalize edge direction (smaller node first) for undirected graph
-            edge = (min(source, target), max(source, target))
-            unique_edges.add(edge)
+        if len(edges_data) == 0:
+            raise ValueError("No valid edges found in the dataset")
         
-        # Convert back to list
+        # Remove duplicate edges - normalize edge direction (smaller node first) for
+        # undirected graph, then keep unique rows
         original_count = len(edges_data)
-        edges_data = list(unique_edges)
+        edges_data = np.unique(np.sort(edges_data, axis=1), axis=0)
         print(f"Removed {original_count - len(edges_data)} duplicate edges")
         
         # Get all unique nodes
-        all_nodes = set()
-        for source, target in edges_data:
-            all_nodes.add(source)
-            all_nodes.add(target)
+        all_nodes = np.unique(edges_data)
         
         # Create igraph Graph
         print(f"Creating network with {len(all_nodes)} nodes and {len(edges_data)} edges...")
         
         # Create graph with specified number of vertices
-        max_node = max(all_nodes)
+        max_node = int(all_nodes[-1])
         graph = ig.Graph(n=max_node + 1, directed=False)
         
         # Add edges (igraph handles duplicate edges automatically)
         graph.add_edges(edges_data)
         
         # Remove isolated vertices to match typical network analysis conventions
-        to_remove = []
-        for i in range(graph.vcount()):
-            if graph.degree(i) == 0:
-                to_remove.append(i)
+        to_remove = np.flatnonzero(np.asarray(graph.degree()) == 0).tolist()
         
         if to_remove:
             graph.delete_vertices(to_remove)
@@ -154,11 +198,24 @@ def construct_london_transport_network() -> ig.Graph:
     except requests.RequestException as e:
         raise requests.RequestException(f"Failed to download data: {e}")
     except zipfile.BadZipFile as e:
+        # Drop a corrupt cached copy so the next run downloads it again
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
         raise zipfile.BadZipFile(f"Invalid zip file: {e}")
     except Exception as e:
         raise ValueError(f"Error processing network data: {e}")
 
 
+def construct_london_transport_network_copy() -> ig.Graph:
+    """
+    Return a private copy of the London Transportation Network that is safe to modify.
+    
+    Returns:
+        ig.Graph: Copy of the shared graph from construct_london_transport_network()
+    """
+    return construct_london_transport_network().copy()
+
+
 def get_network_info(graph: ig.Graph) -> dict:
     """
     Get basic information about a network.